@@ -1,16 +1,22 @@
-import os
+import shutil
 import logging
 import warnings
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.csv as pa_csv
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from datetime import datetime
+from datetime import datetime, timedelta
+from functools import cached_property
 from typing import Dict
 
 from utils.api_utils import MSGraphApi
 from utils.dataframe_utils import (
     check_patient_db_constraints,
     add_id_col,
+    normalize_in_chunks,
     normalize_users,
     normalize_patients,
     normalize_patient_notes,
@@ -27,9 +33,10 @@ from utils.dataframe_utils import (
 from utils.db_utils import DatabaseManager
 from medicare_rebuild.helpers import (
     create_directory,
-    get_files_in_dir,
-    delete_files_in_dir,
+    pipeline_cache,
+    write_dataframe,
 )
+from medicare_rebuild.config import Settings
 from medicare_rebuild.logger import setup_logger
 from medicare_rebuild.queries import (
     get_notes_log_stmt,
@@ -46,9 +53,14 @@ from medicare_rebuild.queries import (
     update_user_note_stmt,
 )
 
+# Microsoft Graph user fields consumed by normalize_users.
+GRAPH_USER_COLS = ["givenName", "surname", "displayName", "mail", "id"]
+
 
 class DataImporter:
-    def __init__(self, start_date, end_date, logger=None):
+    def __init__(
+        self, start_date, end_date, logger=None, use_cache=False, settings=None
+    ):
         """
         Initializes the DataImporter with the given start and end dates.
 
@@ -56,6 +68,8 @@ class DataImporter:
             start_date (str, datetime): The start date for data import.
             end_date (str, datetime): The end date for data import.
             logger (logging.Logger): Logger instance for logging. Defaults to None (optional).
+            use_cache (bool): Whether to reuse cached extractor results for the date range. Defaults to False (optional).
+            settings (Settings): Connection settings. Defaults to None, read from the environment (optional).
         """
         if isinstance(start_date, str):
             self.start_date = datetime.strptime(start_date, "%Y-%m-%d")
@@ -63,26 +77,64 @@ class DataImporter:
             self.end_date = datetime.strptime(end_date, "%Y-%m-%d")
 
         self.logger = logger or logging.getLogger(__name__)
+        self.settings = settings or Settings.from_env()
         self.gps = DatabaseManager(logger=self.logger)
         self.gps.create_engine(
-            username=os.getenv("LCH_SQL_GPS_USERNAME"),
-            password=os.getenv("LCH_SQL_GPS_PASSWORD"),
-            host=os.getenv("LCH_SQL_GPS_HOST"),
-            database=os.getenv("LCH_SQL_GPS_DB"),
+            username=self.settings.sql_gps_username,
+            password=self.settings.sql_gps_password,
+            host=self.settings.sql_gps_host,
+            database=self.settings.sql_gps_db,
+        )
+        # Glucose and blood pressure readings share one engine and connection pool.
+        self.readings_db = DatabaseManager(logger=self.logger)
+        self.readings_db.create_engine(
+            username=self.settings.sql_username,
+            password=self.settings.sql_password,
+            host=self.settings.sql_host,
+            database=self.settings.sql_sp_readings,
         )
         self.snaps_dir = Path.cwd() / "data" / "snaps"
+        self.cache_dir = Path.cwd() / "data" / "cache"
+        self.use_cache = use_cache
+
+    @cached_property
+    def msgraph(self) -> MSGraphApi:
+        """
+        Microsoft Graph API client shared by the Graph extractors. Created on first use.
+
+        Returns:
+            MSGraphApi: The Microsoft Graph API client.
+        """
+        return MSGraphApi(
+            tenant_id=self.settings.azure_tenant_id,
+            client_id=self.settings.azure_client_id,
+            client_secret=self.settings.azure_client_secret,
+            logger=self.logger,
+        )
+
+    def _ensure_token(self) -> None:
+        """
+        Requests a Microsoft Graph access token if there is none or it expires within five minutes.
+        """
+        expires = self.msgraph.token_expires
+        if expires is None or expires - datetime.now() < timedelta(minutes=5):
+            self.msgraph.request_access_token()
 
     @staticmethod
-    def snap_dataframe(df: pd.DataFrame, path: Path | str) -> None:
+    def snap_dataframe(
+        df: pd.DataFrame, path: Path | str, fmt: str = "parquet"
+    ) -> None:
         """
-        Saves a DataFrame to an Excel file.
+        Saves a DataFrame to a Parquet or Excel file. The file suffix is set from the format.
 
         Args:
             df (pd.DataFrame): The DataFrame to save.
-            path (Path, str): The path to save the Excel file.
+            path (Path, str): The path to save the file.
+            fmt (str): The file format, either 'parquet' or 'xlsx'. Defaults to 'parquet' (optional).
         """
-        df.to_excel(path, index=False, engine="openpyxl")
+        write_dataframe(df, Path(path).with_suffix(f".{fmt}"))
 
+    @pipeline_cache
     def get_user_data(self, snap: bool = False) -> pd.DataFrame:
         """
         Retrieves user data from Microsoft Graph API and normalizes it.
@@ -93,18 +145,12 @@ class DataImporter:
         Returns:
             pd.DataFrame: The normalized user data.
         """
-        msg = MSGraphApi(
-            tenant_id=os.getenv("AZURE_TENANT_ID"),
-            client_id=os.getenv("AZURE_CLIENT_ID"),
-            client_secret=os.getenv("AZURE_CLIENT_SECRET"),
-            logger=self.logger,
-        )
-        msg.request_access_token()
-        data = msg.get_group_members("4bbe3379-1250-4522-92e6-017f77517470")
-        df = pd.DataFrame(data["value"])
+        self._ensure_token()
+        data = self.msgraph.get_group_members("4bbe3379-1250-4522-92e6-017f77517470")
+        df = pd.DataFrame.from_records(data["value"], columns=GRAPH_USER_COLS)
         df = normalize_users(df)
         if snap:
-            self.snap_dataframe(df, self.snaps_dir / "snap_user_df.xlsx")
+            self.snap_dataframe(df, self.snaps_dir / "snap_user_df")
         return df
 
     def get_patient_data(
@@ -120,15 +166,30 @@ class DataImporter:
         Returns:
             Dict[str, pd.DataFrame]: A dictionary of normalized patient data DataFrames.
         """
-        df = pd.read_csv(
-            filename,
-            dtype={"Phone Number": "str", "Social Security": "str", "Zip code": "str"},
-            parse_dates=["DOB", "On-board Date"],
+        # Identifier columns are read as strings so leading zeros are kept.
+        # Date columns are parsed by the CSV reader using the export's known formats.
+        convert_options = pa_csv.ConvertOptions(
+            column_types={
+                "Phone Number": pa.string(),
+                "Social Security": pa.string(),
+                "Zip code": pa.string(),
+            },
+            strings_can_be_null=True,
+            timestamp_parsers=[pa_csv.ISO8601, "%m/%d/%Y"],
         )
+        table = pa_csv.read_csv(filename, convert_options=convert_options)
+        df = table.to_pandas(split_blocks=True, self_destruct=True)
+        del table
+        # Arrow nulls come back as None, downstream standardizing expects NaN.
+        df = df.fillna(np.nan)
+        for col in ["DOB", "On-board Date"]:
+            df[col] = pd.to_datetime(df[col], errors="coerce", cache=True).astype(
+                "datetime64[ns]"
+            )
         self.logger.debug(
             f"Reading patient export from SharePoint (rows: {df.shape[0]}, cols: {df.shape[1]})"
         )
-        df = normalize_patients(df)
+        df = normalize_in_chunks(df, normalize_patients)
         df = check_patient_db_constraints(df)
         res = {
             "patient": create_patient_df(df),
@@ -138,11 +199,13 @@ class DataImporter:
             "status": create_patient_status_df(df),
             "emcontacts": create_emcontacts_df(df),
         }
+        del df
         if snap:
-            for name, df in res.items():
-                self.snap_dataframe(df, self.snaps_dir / f"snap_{name}_df.xlsx")
+            for name, sub_df in res.items():
+                self.snap_dataframe(sub_df, self.snaps_dir / f"snap_{name}_df")
         return res
 
+    @pipeline_cache
     def get_patient_note_data(self, snap: bool = False) -> pd.DataFrame:
         """
         Retrieves and normalizes patient note data from the database.
@@ -155,17 +218,17 @@ class DataImporter:
         """
         notes_db = DatabaseManager(logger=self.logger)
         notes_db.create_engine(
-            username=os.getenv("LCH_SQL_USERNAME"),
-            password=os.getenv("LCH_SQL_PASSWORD"),
-            host=os.getenv("LCH_SQL_HOST"),
-            database=os.getenv("LCH_SQL_SP_NOTES"),
+            username=self.settings.sql_username,
+            password=self.settings.sql_password,
+            host=self.settings.sql_host,
+            database=self.settings.sql_sp_notes,
         )
         time_db = DatabaseManager(logger=self.logger)
         time_db.create_engine(
-            username=os.getenv("LCH_SQL_USERNAME"),
-            password=os.getenv("LCH_SQL_PASSWORD"),
-            host=os.getenv("LCH_SQL_HOST"),
-            database=os.getenv("LCH_SQL_SP_TIME"),
+            username=self.settings.sql_username,
+            password=self.settings.sql_password,
+            host=self.settings.sql_host,
+            database=self.settings.sql_sp_time,
         )
         notes_df = notes_db.read_sql(
             get_notes_log_stmt,
@@ -180,18 +243,31 @@ class DataImporter:
         time_df = time_df.rename(
             columns={"SharPoint_ID": "SharePoint_ID", "Notes": "Note_Type"}
         )
+        # Join on shared integer codes rather than hashing the object key columns.
+        join_keys = ["SharePoint_ID", "Note_ID", "LCH_UPN"]
+        code_keys = [f"_{key}_code" for key in join_keys]
+        for key, code_key in zip(join_keys, code_keys):
+            codes, _ = pd.factorize(
+                pd.concat([notes_df[key], time_df[key]], ignore_index=True)
+            )
+            notes_df[code_key] = codes[: len(notes_df)]
+            time_df[code_key] = codes[len(notes_df) :]
+        time_df = time_df.drop(columns=join_keys)
+        # Duplicate note keys in the time log would repeat notes, the merge raises instead.
         df = pd.merge(
-            notes_df, time_df, on=["SharePoint_ID", "Note_ID", "LCH_UPN"], how="left"
+            notes_df, time_df, on=code_keys, how="left", validate="many_to_one"
         )
-        df["Time_Note"] = df["Time_Note"].fillna(df["Note_Type"])
+        df = df.drop(columns=code_keys)
+        df["Time_Note"] = df["Time_Note"].combine_first(df["Note_Type"])
         df.drop(columns=["Note_ID", "Note_Type"], inplace=True)
-        df = normalize_patient_notes(df)
+        df = normalize_in_chunks(df, normalize_patient_notes)
         if snap:
-            self.snap_dataframe(df, self.snaps_dir / "snap_note_df.xlsx")
+            self.snap_dataframe(df, self.snaps_dir / "snap_note_df")
         time_db.close()
         notes_db.close()
         return df
 
+    @pipeline_cache
     def get_device_data(self, snap: bool = False) -> pd.DataFrame:
         """
         Retrieves and normalizes device data from the database.
@@ -204,17 +280,18 @@ class DataImporter:
         """
         fulfillment_db = DatabaseManager(logger=self.logger)
         fulfillment_db.create_engine(
-            username=os.getenv("LCH_SQL_USERNAME"),
-            password=os.getenv("LCH_SQL_PASSWORD"),
-            host=os.getenv("LCH_SQL_HOST"),
-            database=os.getenv("LCH_SQL_SP_FULFILLMENT"),
+            username=self.settings.sql_username,
+            password=self.settings.sql_password,
+            host=self.settings.sql_host,
+            database=self.settings.sql_sp_fulfillment,
         )
         df = fulfillment_db.read_sql(get_fulfillment_stmt)
         df = normalize_devices(df)
         if snap:
-            self.snap_dataframe(df, self.snaps_dir / "snap_device_df.xlsx")
+            self.snap_dataframe(df, self.snaps_dir / "snap_device_df")
         return df
 
+    @pipeline_cache
     def get_gluc_readings(self, snap: bool = False) -> pd.DataFrame:
         """
         Retrieves and normalizes glucose readings from the database.
@@ -225,23 +302,18 @@ class DataImporter:
         Returns:
             pd.DataFrame: The normalized glucose readings.
         """
-        readings_db = DatabaseManager(logger=self.logger)
-        readings_db.create_engine(
-            username=os.getenv("LCH_SQL_USERNAME"),
-            password=os.getenv("LCH_SQL_PASSWORD"),
-            host=os.getenv("LCH_SQL_HOST"),
-            database=os.getenv("LCH_SQL_SP_READINGS"),
-        )
-        df = readings_db.read_sql(
+        df = self.readings_db.read_sql(
             get_bg_readings_stmt,
             params=(self.start_date, self.end_date),
             parse_dates=["Time_Recorded", "Time_Recieved"],
+            dtype_backend="pyarrow",
         )
         if snap:
-            self.snap_dataframe(df, self.snaps_dir / "snap_glucose_df.xlsx")
+            self.snap_dataframe(df, self.snaps_dir / "snap_glucose_df")
         df = normalize_bg_readings(df)
         return df
 
+    @pipeline_cache
     def get_bp_readings(self, snap: bool = False) -> pd.DataFrame:
         """
         Retrieves and normalizes blood pressure readings from the database.
@@ -252,23 +324,52 @@ class DataImporter:
         Returns:
             pd.DataFrame: The normalized blood pressure readings.
         """
-        readings_db = DatabaseManager(logger=self.logger)
-        readings_db.create_engine(
-            username=os.getenv("LCH_SQL_USERNAME"),
-            password=os.getenv("LCH_SQL_PASSWORD"),
-            host=os.getenv("LCH_SQL_HOST"),
-            database=os.getenv("LCH_SQL_SP_READINGS"),
-        )
-        df = readings_db.read_sql(
+        df = self.readings_db.read_sql(
             get_bp_readings_stmt,
             params=(self.start_date, self.end_date),
             parse_dates=["Time_Recorded", "Time_Recieved"],
+            dtype_backend="pyarrow",
         )
         if snap:
-            self.snap_dataframe(df, self.snaps_dir / "snap_blood_pressure_df.xlsx")
+            self.snap_dataframe(df, self.snaps_dir / "snap_blood_pressure_df")
         df = normalize_bp_readings(df)
         return df
 
+    @cached_property
+    def patient_ids(self) -> pd.Series:
+        """
+        Patient IDs from the database, indexed by SharePoint ID. Queried once and cached.
+
+        Returns:
+            pd.Series: The patient IDs.
+        """
+        return self.gps.read_sql(get_patient_id_stmt).set_index("sharepoint_id")[
+            "patient_id"
+        ]
+
+    @cached_property
+    def device_ids(self) -> pd.Series:
+        """
+        Device IDs from the database, indexed by patient ID. Queried once and cached.
+        A patient with several devices has one entry per device.
+
+        Returns:
+            pd.Series: The device IDs.
+        """
+        return self.gps.read_sql(get_device_id_stmt).set_index("patient_id")[
+            "device_id"
+        ]
+
+    @cached_property
+    def vendor_ids(self) -> pd.Series:
+        """
+        Vendor IDs from the database, indexed by vendor name. Queried once and cached.
+
+        Returns:
+            pd.Series: The vendor IDs.
+        """
+        return self.gps.read_sql(get_vendor_id_stmt).set_index("name")["vendor_id"]
+
     def import_user_data(self, df: pd.DataFrame) -> None:
         """
         Imports user data into the database.
@@ -286,22 +387,23 @@ class DataImporter:
             patient_data (Dict[str, pd.DataFrame]): A dictionary of patient data DataFrames to import.
         """
         self.gps.to_sql(patient_data["patient"], "patient", if_exists="append")
-        patient_id_df = self.gps.read_sql(get_patient_id_stmt)
+        # New patient rows were just written, drop any stale cached IDs.
+        self.__dict__.pop("patient_ids", None)
 
         address_df = add_id_col(
-            df=patient_data["address"], id_df=patient_id_df, col="sharepoint_id"
+            df=patient_data["address"], id_df=self.patient_ids, col="sharepoint_id"
         )
         insurance_df = add_id_col(
-            df=patient_data["insurance"], id_df=patient_id_df, col="sharepoint_id"
+            df=patient_data["insurance"], id_df=self.patient_ids, col="sharepoint_id"
         )
         med_nec_df = add_id_col(
-            df=patient_data["med_nec"], id_df=patient_id_df, col="sharepoint_id"
+            df=patient_data["med_nec"], id_df=self.patient_ids, col="sharepoint_id"
         )
         patient_status_df = add_id_col(
-            df=patient_data["status"], id_df=patient_id_df, col="sharepoint_id"
+            df=patient_data["status"], id_df=self.patient_ids, col="sharepoint_id"
         )
         emcontacts_df = add_id_col(
-            df=patient_data["emcontacts"], id_df=patient_id_df, col="sharepoint_id"
+            df=patient_data["emcontacts"], id_df=self.patient_ids, col="sharepoint_id"
         )
 
         self.gps.to_sql(address_df, "patient_address", if_exists="append")
@@ -317,9 +419,8 @@ class DataImporter:
         Args:
             df (pd.DataFrame): The patient note data DataFrame to import.
         """
-        patient_id_df = self.gps.read_sql(get_patient_id_stmt)
-        df = add_id_col(df, id_df=patient_id_df, col="sharepoint_id")
-        self.gps.to_sql(df, "patient_note", if_exists="append")
+        df = add_id_col(df, id_df=self.patient_ids, col="sharepoint_id")
+        self.gps.to_sql(df, "patient_note", if_exists="append", chunksize=10000)
 
     def import_device_data(self, df: pd.DataFrame) -> None:
         """
@@ -328,12 +429,10 @@ class DataImporter:
         Args:
             df (pd.DataFrame): The device data DataFrame to import.
         """
-        patient_id_df = self.gps.read_sql(get_patient_id_stmt)
-        vendor_id_df = self.gps.read_sql(get_vendor_id_stmt)
-        df = add_id_col(df=df, id_df=patient_id_df, col="sharepoint_id")
-        vendor_id_df = vendor_id_df.rename(columns={"name": "Vendor"})
-        df = add_id_col(df=df, id_df=vendor_id_df, col="Vendor")
+        df = add_id_col(df=df, id_df=self.patient_ids, col="sharepoint_id")
+        df = add_id_col(df=df, id_df=self.vendor_ids, col="Vendor")
         self.gps.to_sql(df, "device", if_exists="append")
+        self.__dict__.pop("device_ids", None)
 
     def import_gluc_readings_data(self, df: pd.DataFrame) -> None:
         """
@@ -342,11 +441,9 @@ class DataImporter:
         Args:
             df (pd.DataFrame): The glucose readings data DataFrame to import.
         """
-        patient_id_df = self.gps.read_sql(get_patient_id_stmt)
-        device_id_df = self.gps.read_sql(get_device_id_stmt)
-        df = add_id_col(df=df, id_df=patient_id_df, col="sharepoint_id")
-        df = add_id_col(df=df, id_df=device_id_df, col="patient_id")
-        self.gps.to_sql(df, "glucose_reading", if_exists="append")
+        df = add_id_col(df=df, id_df=self.patient_ids, col="sharepoint_id")
+        df = add_id_col(df=df, id_df=self.device_ids, col="patient_id")
+        self.gps.to_sql(df, "glucose_reading", if_exists="append", chunksize=10000)
 
     def import_bp_readings_data(self, df: pd.DataFrame) -> None:
         """
@@ -355,21 +452,30 @@ class DataImporter:
         Args:
             df (pd.DataFrame): The blood pressure readings data DataFrame to import.
         """
-        patient_id_df = self.gps.read_sql(get_patient_id_stmt)
-        device_id_df = self.gps.read_sql(get_device_id_stmt)
-        df = add_id_col(df=df, id_df=patient_id_df, col="sharepoint_id")
-        df = add_id_col(df=df, id_df=device_id_df, col="patient_id")
-        self.gps.to_sql(df, "blood_pressure_reading", if_exists="append")
+        df = add_id_col(df=df, id_df=self.patient_ids, col="sharepoint_id")
+        df = add_id_col(df=df, id_df=self.device_ids, col="patient_id")
+        self.gps.to_sql(
+            df, "blood_pressure_reading", if_exists="append", chunksize=10000
+        )
 
     def close_db(self) -> None:
         """
-        Closes the database connection.
+        Closes the database connections.
         """
         if self.gps:
             self.gps.close()
-
-
-def import_all_data(start_date, end_date, snap=False, logger=logging.getLogger()):
+        if self.readings_db:
+            self.readings_db.close()
+
+
+def import_all_data(
+    start_date,
+    end_date,
+    snap=False,
+    use_cache=False,
+    settings=None,
+    logger=logging.getLogger(),
+):
     """
     Imports all data within the specified date range.
 
@@ -377,89 +483,122 @@ def import_all_data(start_date, end_date, snap=False, logger=logging.getLogger()
         start_date (str, datetime): The start date for data import.
         end_date (str, datetime): The end date for data import.
         snap (bool): Whether to save a snapshot of the DataFrame. Defaults to False (optional).
+        use_cache (bool): Whether to reuse extractor results cached under data/cache. Delete the directory to invalidate. Defaults to False (optional).
+        settings (Settings): Connection settings. Defaults to None, read from the environment (optional).
         logger (logging.Logger): Logger instance for logging. Defaults to logging.getLogger() (optional).
     """
+    settings = settings or Settings.from_env()
     gps = DatabaseManager(logger=logger)
     gps.create_engine(
-        username=os.getenv("LCH_SQL_GPS_USERNAME"),
-        password=os.getenv("LCH_SQL_GPS_PASSWORD"),
-        host=os.getenv("LCH_SQL_GPS_HOST"),
-        database=os.getenv("LCH_SQL_GPS_DB"),
+        username=settings.sql_gps_username,
+        password=settings.sql_gps_password,
+        host=settings.sql_gps_host,
+        database=settings.sql_gps_db,
     )
     gps.execute_query("EXEC reset_all_billing_tables")
 
     data_dir = Path.cwd() / "data"
     snaps_dir = data_dir / "snaps"
-    if not snaps_dir.exists():
-        create_directory(snaps_dir)
-    if get_files_in_dir(snaps_dir):
-        delete_files_in_dir(snaps_dir)
-
-    dim = DataImporter(start_date, end_date, logger=logger)
-    user_df = dim.get_user_data(snap=snap)
-    dim.import_user_data(user_df)
-    patient_data = dim.get_patient_data(data_dir / "Patient_Export.csv", snap=snap)
-    dim.import_patient_data(patient_data)
-    device_df = dim.get_device_data(snap=snap)
-    dim.import_device_data(device_df)
-    gluc_df = dim.get_gluc_readings(snap=snap)
-    dim.import_gluc_readings_data(gluc_df)
-    bp_df = dim.get_bp_readings(snap=snap)
-    dim.import_bp_readings_data(bp_df)
+    shutil.rmtree(snaps_dir, ignore_errors=True)
+    create_directory(snaps_dir)
+
+    dim = DataImporter(
+        start_date, end_date, logger=logger, use_cache=use_cache, settings=settings
+    )
+    # Extractors hit separate sources and share no state, so they run concurrently.
+    # Imports share the GPS connection and must stay serial.
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        user_future = executor.submit(dim.get_user_data, snap=snap)
+        patient_future = executor.submit(
+            dim.get_patient_data, data_dir / "Patient_Export.csv", snap=snap
+        )
+        device_future = executor.submit(dim.get_device_data, snap=snap)
+        gluc_future = executor.submit(dim.get_gluc_readings, snap=snap)
+        bp_future = executor.submit(dim.get_bp_readings, snap=snap)
+
+    dim.import_user_data(user_future.result())
+    dim.import_patient_data(patient_future.result())
+    dim.import_device_data(device_future.result())
+    dim.import_gluc_readings_data(gluc_future.result())
+    dim.import_bp_readings_data(bp_future.result())
     dim.close_db()
 
-    gps.execute_query(update_patient_note_stmt)
-    gps.execute_query(update_patient_status_stmt)
-    gps.execute_query(update_user_stmt)
-    gps.execute_query(update_user_note_stmt)
+    gps.execute_many(
+        [
+            update_patient_note_stmt,
+            update_patient_status_stmt,
+            update_user_stmt,
+            update_user_note_stmt,
+        ]
+    )
     gps.close()
 
 
-def create_billing_report(start_date, end_date, logger=logging.getLogger()):
+def create_billing_report(
+    start_date,
+    end_date,
+    report_path=None,
+    settings=None,
+    logger=logging.getLogger(),
+):
     """
     Creates a billing report for the specified date range.
 
     Args:
         start_date (str, datetime): The start date for the billing report.
         end_date (str, datetime): The end date for the billing report.
+        report_path (Path, str): Report file ending in '.xlsx', '.csv', or '.parquet'. Defaults to data/LCH_Billing_Report.xlsx (optional).
+        settings (Settings): Connection settings. Defaults to None, read from the environment (optional).
         logger (logging.Logger): Logger instance for logging. Defaults to logging.getLogger() (optional).
     """
+    settings = settings or Settings.from_env()
     if isinstance(start_date, str):
         start_date = datetime.strptime(start_date, "%Y-%m-%d")
     if isinstance(end_date, str):
         end_date = datetime.strptime(end_date, "%Y-%m-%d")
     gps = DatabaseManager(logger=logger)
     gps.create_engine(
-        username=os.getenv("LCH_SQL_GPS_USERNAME"),
-        password=os.getenv("LCH_SQL_GPS_PASSWORD"),
-        host=os.getenv("LCH_SQL_GPS_HOST"),
-        database=os.getenv("LCH_SQL_GPS_DB"),
+        username=settings.sql_gps_username,
+        password=settings.sql_gps_password,
+        host=settings.sql_gps_host,
+        database=settings.sql_gps_db,
     )
     medcode_params = {"today_date": end_date}
 
-    gps.execute_query("EXEC reset_medical_code_tables")
-    gps.execute_query("EXEC batch_medcode_99202")
-    gps.execute_query("EXEC batch_medcode_99453_bg")
-    gps.execute_query("EXEC batch_medcode_99453_bp")
-    gps.execute_query("EXEC batch_medcode_99454_bg :today_date", medcode_params)
-    gps.execute_query("EXEC batch_medcode_99454_bp :today_date", medcode_params)
-    gps.execute_query("EXEC batch_medcode_99457 :today_date", medcode_params)
-    gps.execute_query("EXEC batch_medcode_99458 :today_date", medcode_params)
+    # One connection and commit for the whole run, a failed batch leaves the medical codes untouched.
+    committed = gps.execute_many(
+        [
+            "EXEC reset_medical_code_tables",
+            "EXEC batch_medcode_99202",
+            "EXEC batch_medcode_99453_bg",
+            "EXEC batch_medcode_99453_bp",
+            "EXEC batch_medcode_99454_bg :today_date",
+            "EXEC batch_medcode_99454_bp :today_date",
+            "EXEC batch_medcode_99457 :today_date",
+            "EXEC batch_medcode_99458 :today_date",
+        ],
+        medcode_params,
+    )
+    if not committed:
+        gps.close()
+        raise RuntimeError(
+            "Medical code procedures failed and were rolled back, the billing report was not written."
+        )
 
     df = gps.read_sql(
         "EXEC create_billing_report @start_date = ?, @end_date = ?",
         params=(start_date, end_date),
     )
-    df.to_excel(
-        Path.cwd() / "data" / "LCH_Billing_Report.xlsx", index=False, engine="openpyxl"
-    )
+    write_dataframe(df, report_path or Path.cwd() / "data" / "LCH_Billing_Report.xlsx")
     gps.close()
 
 
 if __name__ == "__main__":
     warnings.filterwarnings("ignore")
     load_dotenv()
+    settings = Settings.from_env()
     logger = setup_logger("main", level="debug")
 
-    import_all_data("2025-01-01", "2025-02-28", logger=logger)
-    create_billing_report("2025-02-01", "2025-02-28", logger=logger)
+    import_all_data("2025-01-01", "2025-02-28", settings=settings, logger=logger)
+    create_billing_report("2025-02-01", "2025-02-28", settings=settings, logger=logger)
+    DatabaseManager.dispose_all()
@@ -0,0 +1,50 @@
+import os
+from dataclasses import dataclass, field
+
+
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """
+    Connection settings read once from the environment.
+    Call Settings.from_env() after load_dotenv() so values from the .env file are included.
+    """
+
+    sql_gps_username: str = None
+    sql_gps_password: str = field(default=None, repr=False)
+    sql_gps_host: str = None
+    sql_gps_db: str = None
+    sql_username: str = None
+    sql_password: str = field(default=None, repr=False)
+    sql_host: str = None
+    sql_sp_notes: str = None
+    sql_sp_time: str = None
+    sql_sp_fulfillment: str = None
+    sql_sp_readings: str = None
+    azure_tenant_id: str = None
+    azure_client_id: str = None
+    azure_client_secret: str = field(default=None, repr=False)
+
+    @classmethod
+    def from_env(cls) -> "Settings":
+        """
+        Creates the settings from the current environment variables.
+
+        Returns:
+            Settings: The frozen settings.
+        """
+        return cls(
+            sql_gps_username=os.getenv("LCH_SQL_GPS_USERNAME"),
+            sql_gps_password=os.getenv("LCH_SQL_GPS_PASSWORD"),
+            sql_gps_host=os.getenv("LCH_SQL_GPS_HOST"),
+            sql_gps_db=os.getenv("LCH_SQL_GPS_DB"),
+            sql_username=os.getenv("LCH_SQL_USERNAME"),
+            sql_password=os.getenv("LCH_SQL_PASSWORD"),
+            sql_host=os.getenv("LCH_SQL_HOST"),
+            sql_sp_notes=os.getenv("LCH_SQL_SP_NOTES"),
+            sql_sp_time=os.getenv("LCH_SQL_SP_TIME"),
+            sql_sp_fulfillment=os.getenv("LCH_SQL_SP_FULFILLMENT"),
+            sql_sp_readings=os.getenv("LCH_SQL_SP_READINGS"),
+            azure_tenant_id=os.getenv("AZURE_TENANT_ID"),
+            azure_client_id=os.getenv("AZURE_CLIENT_ID"),
+            azure_client_secret=os.getenv("AZURE_CLIENT_SECRET"),
+        )
@@ -1,7 +1,12 @@
+import os
 import calendar
+import hashlib
+import inspect
+import functools
+import pandas as pd
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, List, Tuple
 
 
 def create_directory(path: Path | str) -> None:
@@ -33,7 +38,8 @@ def get_files_in_dir(path: Path | str) -> List[Path]:
     if isinstance(path, str):
         path = Path(path)
     if path.is_dir():
-        return [item for item in path.iterdir() if item.is_file()]
+        with os.scandir(path) as entries:
+            return [Path(entry.path) for entry in entries if entry.is_file()]
 
 
 def delete_files_in_dir(path: Path | str) -> None:
@@ -45,9 +51,38 @@ def delete_files_in_dir(path: Path | str) -> None:
     if isinstance(path, str):
         path = Path(path)
     if path.exists():
-        for file in path.glob("*"):
-            if file.is_file():
-                file.unlink()
+        with os.scandir(path) as entries:
+            for entry in entries:
+                if entry.is_file():
+                    os.unlink(entry.path)
+
+
+def write_dataframe(df: pd.DataFrame, path: Path | str) -> None:
+    """Write a DataFrame to a file, the format is chosen by the file suffix.
+    Excel files are streamed to disk with xlsxwriter in constant memory mode.
+
+    Args:
+        df (pandas.DataFrame): The DataFrame to write.
+        path (Path, str): File path ending in '.parquet', '.xlsx', or '.csv'.
+
+    Raises:
+        ValueError: If the file suffix is not supported.
+    """
+    if isinstance(path, str):
+        path = Path(path)
+    if path.suffix == ".parquet":
+        df.to_parquet(path, index=False, engine="pyarrow", compression="zstd")
+    elif path.suffix == ".xlsx":
+        with pd.ExcelWriter(
+            path,
+            engine="xlsxwriter",
+            engine_kwargs={"options": {"constant_memory": True}},
+        ) as writer:
+            df.to_excel(writer, index=False)
+    elif path.suffix == ".csv":
+        df.to_csv(path, index=False)
+    else:
+        raise ValueError(f"Unsupported file format: {path.suffix}")
 
 
 def get_last_month_billing_cycle() -> Tuple[datetime, datetime]:
@@ -66,3 +101,40 @@ def get_last_month_billing_cycle() -> Tuple[datetime, datetime]:
     last_day = datetime(year, month, calendar.monthrange(year, month)[1])
 
     return first_day, last_day
+
+
+def pipeline_cache(func: Callable[..., pd.DataFrame]) -> Callable[..., pd.DataFrame]:
+    """Cache the DataFrame returned by a DataImporter method to a parquet file.
+    The cache key is the method name with the importer's start and end dates.
+    Caching is skipped unless the importer's use_cache attribute is True.
+    Snapshots are taken inside the method, so a call with snap=True always runs it and refreshes the cache.
+
+    Args:
+        func (Callable): DataImporter method returning a DataFrame.
+
+    Returns:
+        Callable: The wrapped method.
+    """
+
+    signature = inspect.signature(func)
+
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs) -> pd.DataFrame:
+        if not self.use_cache:
+            return func(self, *args, **kwargs)
+        key = f"{func.__name__}|{self.start_date}|{self.end_date}"
+        digest = hashlib.sha1(key.encode()).hexdigest()
+        path = self.cache_dir / f"{func.__name__}_{digest}.parquet"
+        snap = signature.bind(self, *args, **kwargs).arguments.get("snap", False)
+        if path.exists() and not snap:
+            self.logger.debug(f"Reading cached {func.__name__} from {path.name}")
+            return pd.read_parquet(path)
+        df = func(self, *args, **kwargs)
+        create_directory(self.cache_dir)
+        try:
+            df.to_parquet(path, index=False)
+        except Exception as e:
+            self.logger.warning(f"Unable to cache {func.__name__}: {e}")
+        return df
+
+    return wrapper
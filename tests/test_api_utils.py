@@ -1,5 +1,10 @@
+import time
 import pytest
+import threading
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from requests.exceptions import ConnectionError, Timeout, RequestException
+from utils import api_utils
 from utils.api_utils import RestAdapter, MSGraphApi, TenoviApi
 
 
@@ -37,6 +42,19 @@ def test_put_request_success(rest_adapter, requests_mock):
     assert response == {"key": "value"}
 
 
+def test_put_request_json(rest_adapter, requests_mock):
+    endpoint = "/test"
+    requests_mock.put(
+        f"https://api.example.com{endpoint}",
+        json={"key": "value"},
+        headers={"Content-Type": "application/json"},
+    )
+    response = rest_adapter.put(endpoint, json={"data": "value"})
+    assert response == {"key": "value"}
+    assert requests_mock.last_request.headers["Content-Type"] == "application/json"
+    assert requests_mock.last_request.json() == {"data": "value"}
+
+
 def test_delete_request_success(rest_adapter, requests_mock):
     endpoint = "/test"
     requests_mock.delete(
@@ -74,8 +92,166 @@ def test_request_unexpected_error(rest_adapter, requests_mock):
     assert response is None
 
 
+def test_rest_adapter_shared_session(rest_adapter):
+    shared = RestAdapter(
+        base_url="https://other.example.com", session=rest_adapter.session
+    )
+    assert shared.session is rest_adapter.session
+    adapter = rest_adapter.session.get_adapter("https://api.example.com")
+    assert adapter._pool_maxsize == 50
+    assert 503 in adapter.max_retries.status_forcelist
+    assert adapter.max_retries.backoff_jitter == 0.25
+
+
+def test_retry_post_only_when_throttled(rest_adapter):
+    retry = rest_adapter.session.get_adapter("https://").max_retries
+    assert retry.is_retry("POST", 429, has_retry_after=True)
+    assert not retry.is_retry("POST", 503)
+    assert retry.is_retry("GET", 503)
+    assert retry.new(total=1).is_retry("POST", 429)
+
+
+def test_sessions_share_connection_pools(rest_adapter):
+    other = RestAdapter(base_url="https://other.example.com", headers={"X-Key": "1"})
+    assert other.session is not rest_adapter.session
+    assert "X-Key" not in rest_adapter.session.headers
+    assert other.session.get_adapter("https://") is rest_adapter.session.get_adapter(
+        "https://"
+    )
+
+
+def test_get_request_html(rest_adapter, requests_mock):
+    requests_mock.get(
+        "https://api.example.com/page",
+        content="<p>café</p>".encode("utf-8"),
+        headers={"Content-Type": "text/html"},
+    )
+    assert rest_adapter.get("/page") == "<p>café</p>"
+
+
+def test_get_request_content_types(rest_adapter, requests_mock):
+    requests_mock.get(
+        "https://api.example.com/json",
+        content=b'{"key": "value"}',
+        headers={"Content-Type": "Application/JSON; charset=utf-8"},
+    )
+    requests_mock.get(
+        "https://api.example.com/file",
+        content=b"raw",
+        headers={"Content-Type": "application/octet-stream"},
+    )
+    assert rest_adapter.get("/json") == {"key": "value"}
+    assert rest_adapter.get("/file") == b"raw"
+
+
+def test_get_request_cache(requests_mock):
+    rest_adapter = RestAdapter(
+        base_url="https://api.example.com", enable_cache=True, cache_size=1
+    )
+    for endpoint in ["/cached", "/other"]:
+        requests_mock.get(
+            f"https://api.example.com{endpoint}",
+            json={"key": endpoint},
+            headers={"Content-Type": "application/json"},
+        )
+    assert rest_adapter.get("/cached", params={"a": 1}) == {"key": "/cached"}
+    assert rest_adapter.get("/cached", params={"a": 1}) == {"key": "/cached"}
+    assert requests_mock.call_count == 1
+    rest_adapter.get("/other")
+    rest_adapter.get("/cached", params={"a": 1})
+    assert requests_mock.call_count == 3
+
+
+def test_get_request_list_params(requests_mock):
+    rest_adapter = RestAdapter(base_url="https://api.example.com")
+    cached_adapter = RestAdapter(base_url="https://api.example.com", enable_cache=True)
+    requests_mock.get(
+        "https://api.example.com/items",
+        json={"key": "value"},
+        headers={"Content-Type": "application/json"},
+    )
+    params = {"id": [1, 2]}
+    assert rest_adapter.get("/items", params=params) == {"key": "value"}
+    assert cached_adapter.get("/items", params=params) == {"key": "value"}
+    assert cached_adapter.get("/items", params=params) == {"key": "value"}
+    assert requests_mock.call_count == 2
+    assert requests_mock.last_request.qs == {"id": ["1", "2"]}
+    assert cached_adapter.get("/items", params={"id": {3}}) == {"key": "value"}
+    assert requests_mock.call_count == 3
+
+
+def test_get_request_cache_revalidate(requests_mock):
+    rest_adapter = RestAdapter(
+        base_url="https://api.example.com", enable_cache=True, cache_ttl=0
+    )
+    requests_mock.get(
+        "https://api.example.com/devices",
+        [
+            {
+                "json": [{"id": 1}],
+                "headers": {"Content-Type": "application/json", "ETag": '"v1"'},
+            },
+            {"status_code": 304, "headers": {"ETag": '"v1"'}},
+        ],
+    )
+    assert rest_adapter.get("/devices") == [{"id": 1}]
+    assert "If-None-Match" not in requests_mock.last_request.headers
+    assert rest_adapter.get("/devices") == [{"id": 1}]
+    assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+    assert requests_mock.call_count == 2
+
+
+def test_get_request_coalesced(rest_adapter, requests_mock):
+    started, release = threading.Event(), threading.Event()
+
+    def respond(request, context):
+        started.set()
+        release.wait(timeout=5)
+        return {"key": "value"}
+
+    requests_mock.get(
+        "https://api.example.com/shared",
+        json=respond,
+        headers={"Content-Type": "application/json"},
+    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        leader = executor.submit(rest_adapter.get, "/shared", params={"a": 1})
+        started.wait(timeout=5)
+        follower = executor.submit(rest_adapter.get, "/shared", params={"a": 1})
+        time.sleep(0.1)
+        release.set()
+        assert leader.result() == follower.result() == {"key": "value"}
+    assert requests_mock.call_count == 1
+    assert not rest_adapter._inflight
+
+
+def test_get_request_coalesced_options(rest_adapter, requests_mock):
+    started, release = threading.Event(), threading.Event()
+
+    def respond(request, context):
+        started.set()
+        release.wait(timeout=5)
+        return {"verify": request.verify}
+
+    requests_mock.get(
+        "https://api.example.com/shared",
+        json=respond,
+        headers={"Content-Type": "application/json"},
+    )
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        first = executor.submit(rest_adapter.get, "/shared", verify=False)
+        started.wait(timeout=5)
+        second = executor.submit(rest_adapter.get, "/shared", verify="/ca.pem")
+        time.sleep(0.1)
+        release.set()
+        assert first.result() == {"verify": False}
+        assert second.result() == {"verify": "/ca.pem"}
+    assert requests_mock.call_count == 2
+
+
 @pytest.fixture
 def ms_graph_api():
+    api_utils._access_tokens.clear()
     return MSGraphApi(
         tenant_id="tenant_id", client_id="client_id", client_secret="client_secret"
     )
@@ -86,17 +262,133 @@ def test_request_access_token(ms_graph_api, requests_mock):
     requests_mock.post(
         token_endpoint, json={"access_token": "test_token"}, status_code=200
     )
+    session = ms_graph_api.rest.session
     ms_graph_api.request_access_token()
     assert ms_graph_api.rest.session.headers["Authorization"] == "Bearer test_token"
+    assert ms_graph_api.rest.session is session
+    assert "Authorization" not in requests_mock.last_request.headers
+
+
+def test_request_access_token_cached(ms_graph_api, requests_mock):
+    token_endpoint = "https://login.microsoftonline.com/tenant_id/oauth2/v2.0/token"
+    requests_mock.post(
+        token_endpoint,
+        json={"access_token": "test_token", "expires_in": 3599},
+        headers={"Content-Type": "application/json"},
+    )
+    ms_graph_api.request_access_token()
+    other_api = MSGraphApi(
+        tenant_id="tenant_id", client_id="client_id", client_secret="client_secret"
+    )
+    other_api.request_access_token()
+    assert other_api.rest.session.headers["Authorization"] == "Bearer test_token"
+    assert other_api.token_expires == ms_graph_api.token_expires
+    assert requests_mock.call_count == 1
 
 
 def test_get_group_members(ms_graph_api, requests_mock):
+    requests_mock.post(
+        "https://login.microsoftonline.com/tenant_id/oauth2/v2.0/token",
+        json={"access_token": "test_token"},
+        headers={"Content-Type": "application/json"},
+    )
     ms_graph_api.request_access_token()
     group_id = "group_id"
-    endpoint = f"https://graph.microsoft.com/v1.0/groups/{group_id}/members"
-    requests_mock.get(endpoint, json={"value": [{"id": "member_id"}]}, status_code=200)
+    next_link = (
+        f"https://graph.microsoft.com/v1.0/groups/{group_id}/members?$skiptoken=2"
+    )
+    requests_mock.post(
+        "https://graph.microsoft.com/v1.0/$batch",
+        [
+            {
+                "json": {
+                    "responses": [
+                        {
+                            "id": group_id,
+                            "status": 200,
+                            "body": {
+                                "value": [{"id": "member_1"}],
+                                "@odata.nextLink": next_link,
+                            },
+                        }
+                    ]
+                },
+                "headers": {"Content-Type": "application/json"},
+            },
+            {
+                "json": {
+                    "responses": [
+                        {
+                            "id": group_id,
+                            "status": 200,
+                            "body": {"value": [{"id": "member_2"}]},
+                        }
+                    ]
+                },
+                "headers": {"Content-Type": "application/json"},
+            },
+        ],
+    )
     response = ms_graph_api.get_group_members(group_id)
-    assert response == {"value": [{"id": "member_id"}]}
+    assert response == {"value": [{"id": "member_1"}, {"id": "member_2"}]}
+    assert requests_mock.last_request.json() == {
+        "requests": [
+            {
+                "id": group_id,
+                "method": "GET",
+                "url": f"/groups/{group_id}/members?$skiptoken=2",
+            }
+        ]
+    }
+
+
+def test_batch_retries_throttled_requests(ms_graph_api, requests_mock, monkeypatch):
+    delays = []
+    monkeypatch.setattr(api_utils.time, "sleep", delays.append)
+    requests_mock.post(
+        "https://graph.microsoft.com/v1.0/$batch",
+        [
+            {
+                "json": {
+                    "responses": [
+                        {"id": "1", "status": 200, "body": {"value": [1]}},
+                        {"id": "2", "status": 429, "headers": {"Retry-After": "3"}},
+                    ]
+                },
+                "headers": {"Content-Type": "application/json"},
+            },
+            {
+                "json": {"responses": [{"id": "2", "status": 200, "body": {}}]},
+                "headers": {"Content-Type": "application/json"},
+            },
+        ],
+    )
+    batch_requests = [
+        {"id": request_id, "method": "GET", "url": "/users"} for request_id in "12"
+    ]
+    assert ms_graph_api.batch(batch_requests) == {"1": {"value": [1]}, "2": {}}
+    assert delays == [3.0]
+    assert requests_mock.last_request.json() == {"requests": [batch_requests[1]]}
+
+
+def test_batch_failed_requests(ms_graph_api, requests_mock, monkeypatch):
+    monkeypatch.setattr(api_utils.time, "sleep", lambda delay: None)
+    requests_mock.post(
+        "https://graph.microsoft.com/v1.0/$batch",
+        json={"responses": [{"id": "1", "status": 503}]},
+        headers={"Content-Type": "application/json"},
+    )
+    batch_requests = [{"id": "1", "method": "GET", "url": "/users"}]
+    assert ms_graph_api.batch(batch_requests, retries=2) is None
+    assert requests_mock.call_count == 3
+    requests_mock.post(
+        "https://graph.microsoft.com/v1.0/$batch",
+        json={"responses": [{"id": "1", "status": 404}]},
+        headers={"Content-Type": "application/json"},
+    )
+    assert ms_graph_api.get_group_members("1") is None
+    requests_mock.post("https://graph.microsoft.com/v1.0/$batch", status_code=400)
+    assert ms_graph_api.batch(batch_requests) is None
 
 
 @pytest.fixture
@@ -117,3 +409,38 @@ def test_get_readings(tenovi_api, requests_mock):
     requests_mock.get(endpoint, json=[{"reading_id": "reading_1"}], status_code=200)
     response = tenovi_api.get_readings(hwi_device_id)
     assert response == [{"reading_id": "reading_1"}]
+
+
+def test_get_readings_many(tenovi_api, requests_mock):
+    base = "https://api2.tenovi.com/clients/client_domain/hwi/hwi-devices"
+    for hwi_device_id in ["device_1", "device_2"]:
+        requests_mock.get(
+            f"{base}/{hwi_device_id}/measurements/",
+            json=[{"device_id": hwi_device_id}],
+            headers={"Content-Type": "application/json"},
+        )
+    response = tenovi_api.get_readings_many(["device_1", "device_2"], max_workers=2)
+    assert response == [[{"device_id": "device_1"}], [{"device_id": "device_2"}]]
+
+
+def test_get_readings_stream(tenovi_api, requests_mock):
+    endpoint = "https://api2.tenovi.com/clients/client_domain/hwi/hwi-devices/device_id/measurements/"
+    requests_mock.get(
+        endpoint,
+        json={"next": f"{endpoint}?page=2", "results": [{"reading_id": "reading_1"}]},
+        headers={"Content-Type": "application/json"},
+    )
+    requests_mock.get(
+        f"{endpoint}?page=2",
+        json={"next": None, "results": [{"reading_id": "reading_2"}]},
+        headers={"Content-Type": "application/json"},
+    )
+    response = list(tenovi_api.get_readings_stream("device_id"))
+    assert response == [{"reading_id": "reading_1"}, {"reading_id": "reading_2"}]
+
+
+def test_get_readings_created_gte(tenovi_api, requests_mock):
+    endpoint = "https://api2.tenovi.com/clients/client_domain/hwi/hwi-devices/device_id/measurements/"
+    requests_mock.get(endpoint, json=[], headers={"Content-Type": "application/json"})
+    tenovi_api.get_readings("device_id", created_gte=datetime(2024, 1, 2, 3, 4, 5, 6))
+    assert requests_mock.last_request.qs["created__gte"] == ["2024-01-02t03:04:05z"]
@@ -3,10 +3,12 @@ import pandas as pd
 import numpy as np
 
 from utils.dataframe_utils import (
+    compile_keyword_pattern,
     keyword_search,
     keyword_list_search,
     extract_regex_pattern,
     standardize_name,
+    standardize_digits,
     standardize_email,
     standardize_state,
     standardize_mbi,
@@ -22,6 +24,7 @@ from utils.dataframe_utils import (
     standardize_race,
     standardize_weight,
     standardize_height,
+    standardize_reading,
     create_patient_df,
     create_patient_address_df,
     create_patient_insurance_df,
@@ -36,6 +39,11 @@ from utils.dataframe_utils import (
     normalize_bg_readings,
     check_patient_db_constraints,
     add_id_col,
+    apply_unique,
+    to_arrow_text,
+    strip_title,
+    null_nan_columns,
+    normalize_in_chunks,
 )
 
 
@@ -46,6 +54,12 @@ def test_keyword_search():
     assert keyword_search("I have insurance", keywords) is np.nan
 
 
+def test_compile_keyword_pattern():
+    pattern = compile_keyword_pattern(("son", "grandson"))
+    assert pattern.findall("my grandson and son") == ["grandson", "son"]
+    assert compile_keyword_pattern(("son", "grandson")) is pattern
+
+
 def test_keyword_list_search():
     keywords = {"Medicare": [["medicare"]], "Medicaid": [["medicaid"]]}
     assert keyword_list_search("I have Medicare", keywords) == "Medicare"
@@ -59,28 +73,101 @@ def test_extract_regex_pattern():
     assert extract_regex_pattern("No SSN here", pattern) is np.nan
 
 
+def test_to_arrow_text():
+    result = to_arrow_text(pd.Series(["a", np.nan, 1], dtype=object))
+    assert result.dtype == "string[pyarrow]"
+    assert result.tolist() == ["a", "nan", "1"]
+
+
+def test_strip_title():
+    result = strip_title(pd.Series(["  jOHN doe ", np.nan], index=[5, 6]))
+    assert result.dtype == "string[pyarrow]"
+    assert result.index.tolist() == [5, 6]
+    assert result.tolist() == ["John Doe", "Nan"]
+
+
+def test_null_nan_columns():
+    df = pd.DataFrame(
+        {
+            "text": ["nan", "NaN", "na", "Nancy"],
+            "state": pd.Series(["CA", "NAN", "TX", "CA"], dtype="category"),
+            "count": pd.array([1, None, 3, 4], dtype="Int64"),
+        }
+    )
+    result = null_nan_columns(df.copy())
+    assert result["text"].isna().tolist() == [True, True, False, False]
+    assert result["state"].isna().tolist() == [False, True, False, False]
+    assert result["count"].dtype == "Int64"
+    result = null_nan_columns(df.copy(), ("na", "nan"))
+    assert result["text"].isna().tolist() == [True, True, True, False]
+
+
+def test_apply_unique():
+    calls = []
+
+    def upper(value):
+        calls.append(value)
+        return str(value).upper()
+
+    result = apply_unique(pd.Series(["a", "b", "a", np.nan], index=[3, 2, 1, 0]), upper)
+    assert result.tolist() == ["A", "B", "A", "NAN"]
+    assert result.index.tolist() == [3, 2, 1, 0]
+    assert len(calls) == 3
+
+    df = pd.DataFrame({"x": ["a", "a", "b"], "y": [1, 1, 2]})
+    result = apply_unique(df, lambda row: f"{row['x']}{row['y']}")
+    assert result.tolist() == ["a1", "a1", "b2"]
+
+
+def test_normalize_in_chunks():
+    df = pd.DataFrame(
+        {
+            "Patient_ID": ["1", "2", "3", "4"],
+            "Device_ID": ["a-1", "b-2", "c-3", "d-4"],
+            "Device_Name": ["Omron BPM", "Tenovi BPM", "Omron BG", "Tenovi BG"],
+            "Vendor": ["Omron", "Tenovi", "Omron", "Tenovi"],
+        }
+    )
+    result = normalize_in_chunks(
+        df.copy(), normalize_devices, max_workers=2, min_chunk_rows=2
+    )
+    expected = normalize_devices(df.copy())
+    pd.testing.assert_frame_equal(result, expected)
+
+
 def test_standardize_name():
-    assert standardize_name(" john doe ", r"[^a-zA-Z\s.-]") == "John Doe"
+    result = standardize_name(pd.Series([" john  doe ", "mary-ann2"]), r"[^a-zA-Z\s.-]")
+    assert result.tolist() == ["John Doe", "Mary-Ann"]
+    result = standardize_name(pd.Series(["st. louis2"]), re.compile(r"[^a-zA-Z-]"))
+    assert result.tolist() == ["StLouis"]
+
+
+def test_standardize_digits():
+    result = standardize_digits(pd.Series(["(123) 456-7890", "123-45-6789", np.nan]))
+    assert result.tolist() == ["1234567890", "123456789", ""]
 
 
 def test_standardize_email():
-    assert standardize_email("  JOHN.DOE@EXAMPLE.COM  ") == "john.doe@example.com"
-    assert standardize_email("invalid-email") is np.nan
+    result = standardize_email(pd.Series(["  JOHN.DOE@EXAMPLE.COM  ", "invalid-email"]))
+    assert result[0] == "john.doe@example.com"
+    assert pd.isna(result[1])
 
 
 def test_standardize_state():
-    assert standardize_state("california") == "CA"
-    assert standardize_state("invalid-state") == "INVALID-STATE"
+    result = standardize_state(pd.Series([" california ", "tx", "invalid-state"]))
+    assert result.tolist() == ["CA", "TX", "INVALID-STATE"]
+    assert result.dtype == "category"
 
 
 def test_standardize_mbi():
-    assert standardize_mbi(" 1EG4-TE5-MK73 ") == "1EG4TE5MK73"
-    assert standardize_mbi("invalid-mbi") == "INVALID-MBI"
+    result = standardize_mbi(pd.Series([" 1EG4-TE5-MK73 ", "invalid-mbi"]))
+    assert result.tolist() == ["1EG4TE5MK73", "INVALID-MBI"]
 
 
 def test_standardize_dx_code():
-    assert standardize_dx_code("E11.9") == "E119"
-    assert standardize_dx_code("I10, E11.9") == "I10,E119"
+    result = standardize_dx_code(pd.Series(["E11.9", "I10, E11.9"]))
+    assert result.tolist() == ["E119", "I10,E119"]
+    assert standardize_dx_code(pd.Series(["|10, R69"])).tolist() == ["R69"]
 
 
 def test_standardize_insurance_name():
@@ -92,35 +179,37 @@ def test_standardize_insurance_name():
 
 
 def test_standardize_insurance_id():
-    assert standardize_insurance_id(" abc-123-xyz ") == "ABC123XYZ"
-    assert standardize_insurance_id("invalid-id") == "INVALID-ID"
+    result = standardize_insurance_id(pd.Series([" abc-123-xyz ", "invalid-id"]))
+    assert result.tolist() == ["ABC123XYZ", "INVALID-ID"]
 
 
 def test_fill_primary_payer():
-    row = pd.Series(
+    df = pd.DataFrame(
         {
-            "Insurance Name:": np.nan,
-            "Insurance ID:": np.nan,
-            "Medicare ID number": "12345",
+            "Insurance Name:": [np.nan, "Aetna Insurance", "Nan"],
+            "Insurance ID:": [np.nan, np.nan, np.nan],
+            "Medicare ID number": ["12345", "12345", "NAN"],
         }
     )
-    assert fill_primary_payer(row) == "Medicare Part B"
+    result = fill_primary_payer(df)
+    assert result[:2].tolist() == ["Medicare Part B", "Aetna Insurance"]
+    assert pd.isna(result[2])
 
 
 def test_fill_primary_payer_id():
-    row = pd.Series(
+    df = pd.DataFrame(
         {
-            "Insurance Name:": "Medicare Part B",
-            "Insurance ID:": np.nan,
-            "Medicare ID number": "12345",
+            "Insurance Name:": ["Medicare Part B", "Aetna Insurance"],
+            "Insurance ID:": ["NAN", "W123"],
+            "Medicare ID number": ["12345", "12345"],
         }
     )
-    assert fill_primary_payer_id(row) == "12345"
+    assert fill_primary_payer_id(df).tolist() == ["12345", "W123"]
 
 
 def test_standardize_call_time():
-    assert standardize_call_time("1 days 02:30:00") == 93600
-    assert standardize_call_time(None) == 0
+    result = standardize_call_time(pd.Series(["1 days 02:30:00", "00:15:00", None]))
+    assert result.tolist() == [95400, 900, 0]
 
 
 def test_standardize_note_types():
@@ -131,8 +220,17 @@ def test_standardize_note_types():
 
 
 def test_standardize_vendor():
-    row = pd.Series({"Vendor": "Omron", "Device_Name": "Omron Blood Pressure Monitor"})
-    assert standardize_vendor(row) == "Omron"
+    df = pd.DataFrame(
+        {
+            "Vendor": ["Omron", "Omron", "Omron"],
+            "Device_Name": [
+                "Omron Blood Pressure Monitor",
+                "Tenovi Glucometer",
+                "BP Cuff",
+            ],
+        }
+    )
+    assert standardize_vendor(df).tolist() == ["Omron", "Tenovi", "Omron"]
 
 
 def test_standardize_emcontact_relationship():
@@ -148,13 +246,26 @@ def test_standardize_race():
 
 
 def test_standardize_weight():
-    assert standardize_weight("150 lbs") == 150
-    assert standardize_weight("invalid-weight") is np.nan
+    result = standardize_weight(pd.Series(["150 lbs", "invalid-weight", "2105"]))
+    assert result.iloc[0] == 150
+    assert result.iloc[1] is pd.NA
+    assert result.iloc[2] == 210
 
 
 def test_standardize_height():
-    assert standardize_height("5'8\"") == 68
-    assert standardize_height("invalid-height") is np.nan
+    result = standardize_height(
+        pd.Series(["5'8\"", "6 ft", "invalid-height", "180 lbs"])
+    )
+    assert result.tolist()[:2] == [68, 72]
+    assert result.iloc[2:].isna().all()
+
+
+def test_standardize_reading():
+    reading = pd.Series(["120.456", "80", "error"], dtype=object)
+    result = standardize_reading(reading)
+    assert result.tolist()[:2] == [120.46, 80.0]
+    assert pd.isna(result.iloc[2])
+    assert reading.tolist() == ["120.456", "80", "error"]
 
 
 def test_create_patient_df():
@@ -223,6 +334,7 @@ def test_create_med_necessity_df():
     )
     result = create_med_necessity_df(df)
     assert result.shape == (2, 3)
+    assert result["temp_dx_code"].tolist() == ["E11.9", "I10"]
 
 
 def test_create_patient_status_df():
@@ -317,6 +429,23 @@ def test_normalize_patient_notes():
     assert result.shape == (1, 10)
 
 
+def test_normalize_patient_notes_content():
+    df = pd.DataFrame(
+        {
+            "Recording_Time": ["00:15:00", None],
+            "Notes": ['<p class="a\nb">Tom &amp; Jerry</p>', None],
+            "Time_Note": ["Alert", "Alert"],
+            "LCH_UPN": ["Joycelynn Harris", "Joycelynn Harris"],
+            "SharePoint_ID": ["1", "2"],
+            "Auto_Time": [True, False],
+        }
+    )
+    result = normalize_patient_notes(df)
+    assert result["note_content"].dtype == "string[pyarrow]"
+    assert result["note_content"][0] == "Tom & Jerry"
+    assert pd.isna(result["note_content"][1])
+
+
 def test_normalize_devices():
     df = pd.DataFrame(
         {
@@ -378,6 +507,11 @@ def test_check_patient_db_constraints():
     result = check_patient_db_constraints(df)
     assert result.shape == (1, 9)
 
+    df.loc[1] = df.loc[0]
+    df.loc[1, "temp_state"] = "CAL"
+    result = check_patient_db_constraints(df)
+    assert result.index.tolist() == [0]
+
 
 def test_add_id_col():
     df = pd.DataFrame({"name": ["John Doe"], "age": [30]})
@@ -385,3 +519,43 @@ def test_add_id_col():
     result = add_id_col(df, id_df, "name")
     assert result.shape == (1, 3)
     assert "name" not in result.columns
+
+
+def test_add_id_col_series():
+    df = pd.DataFrame({"name": ["John Doe", "Jane Doe"], "age": [30, 25]})
+    id_map = pd.Series([1], index=pd.Index(["John Doe"], name="name"), name="id")
+    result = add_id_col(df, id_map, "name")
+    assert result.shape == (1, 2)
+    assert result["id"].tolist() == [1]
+
+
+def test_add_id_col_duplicate_keys():
+    df = pd.DataFrame({"patient_id": [1, 2], "reading": [100, 120]})
+    id_map = pd.Series(
+        [10, 11, 12], index=pd.Index([1, 1, 2], name="patient_id"), name="device_id"
+    )
+    result = add_id_col(df, id_map, "patient_id")
+    assert result["device_id"].tolist() == [10, 11, 12]
+    assert result["reading"].tolist() == [100, 100, 120]
+    id_df = id_map.reset_index()
+    assert add_id_col(df, id_df, "patient_id").equals(result)
+
+
+def test_normalize_readings_pyarrow_backend():
+    bg_df = pd.DataFrame(
+        {
+            "SharePoint_ID": pd.Series([1, 2], dtype="int64[pyarrow]"),
+            "Device_Model": pd.Series(["Omron", "Omron"], dtype="string[pyarrow]"),
+            "BG_Reading": pd.Series([100.0, 95.5], dtype="double[pyarrow]"),
+            "Manual_Reading": pd.Series([True, None], dtype="bool[pyarrow]"),
+        }
+    )
+    bp_df = bg_df.drop(columns="BG_Reading").assign(
+        BP_Reading_Systolic=pd.Series([120.0, 118.0], dtype="double[pyarrow]"),
+        BP_Reading_Diastolic=pd.Series([80.0, 79.0], dtype="double[pyarrow]"),
+    )
+    bg_result = normalize_bg_readings(bg_df)
+    bp_result = normalize_bp_readings(bp_df)
+    for result in (bg_result, bp_result):
+        assert result["is_manual"].dtype == "Int64"
+        assert result["is_manual"].tolist() == [1, pd.NA]
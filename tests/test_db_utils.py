@@ -1,4 +1,5 @@
 import pytest
+import pandas as pd
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.engine import URL
@@ -18,20 +19,78 @@ def test_create_engine(mock_create_engine, db_manager):
     assert db_manager.engine == mock_engine
     assert isinstance(db_manager.session, sessionmaker)
 
+@patch("utils.db_utils.create_engine")
+def test_create_engine_reuses_engine(mock_create_engine):
+    DatabaseManager._engines.clear()
+    first = DatabaseManager()
+    second = DatabaseManager()
+    first.create_engine("username", "password", "host", "database")
+    second.create_engine("username", "password", "host", "database")
+    assert first.engine is second.engine
+    mock_create_engine.assert_called_once()
+    assert mock_create_engine.call_args.kwargs["fast_executemany"] is True
+    assert mock_create_engine.call_args.kwargs["pool_pre_ping"] is True
+    assert mock_create_engine.call_args.kwargs["pool_recycle"] == 1800
+    assert all("password" not in key[0] for key in DatabaseManager._engines)
+    DatabaseManager.dispose_all()
+    first.engine.dispose.assert_called_once()
+    assert not DatabaseManager._engines
+
 def test_get_session(db_manager):
     db_manager.session = sessionmaker()
     session = db_manager.get_session()
     assert isinstance(session, sessionmaker().__call__())
 
-@patch("sqlalchemy.orm.Session.execute")
-def test_execute_query(mock_execute, db_manager):
-    db_manager.session = sessionmaker()
-    mock_session = db_manager.session()
-    mock_execute.return_value.returns_rows = True
-    mock_execute.return_value.fetchall.return_value = ["result"]
-    with patch.object(mock_session, "execute", mock_execute):
-        result = db_manager.execute_query("SELECT 1")
-        assert result == ["result"]
+def test_execute_query(db_manager):
+    db_manager.engine = create_engine("sqlite://")
+    result = db_manager.execute_query("SELECT 1")
+    assert [tuple(row) for row in result] == [(1,)]
+
+def test_execute_query_without_engine(db_manager):
+    with pytest.raises(Exception):
+        db_manager.execute_query("SELECT 1")
+
+def test_execute_many(db_manager):
+    db_manager.engine = create_engine("sqlite://")
+    db_manager.session = sessionmaker(bind=db_manager.engine)
+    db_manager.execute_many(
+        [
+            "CREATE TABLE note (id INTEGER, type TEXT)",
+            "INSERT INTO note VALUES (1, 'Alert')",
+            "UPDATE note SET type = 'Initial Evaluation' WHERE id = 1",
+        ]
+    )
+    result = db_manager.execute_query("SELECT type FROM note")
+    assert [row[0] for row in result] == ["Initial Evaluation"]
+
+def test_execute_many_rollback(db_manager):
+    db_manager.engine = create_engine("sqlite://")
+    db_manager.execute_query("CREATE TABLE note (id INTEGER, type TEXT)")
+    assert db_manager.execute_many(
+        [
+            "INSERT INTO note VALUES (1, 'Alert')",
+            "INSERT INTO missing VALUES (2)",
+        ]
+    ) is False
+    assert db_manager.execute_query("SELECT id FROM note") == []
+    assert db_manager.execute_many(["INSERT INTO note VALUES (1, 'Alert')"]) is True
+
+def test_execute_batch(db_manager):
+    db_manager.engine = create_engine("sqlite://")
+    db_manager.execute_query("CREATE TABLE note (id INTEGER, type TEXT)")
+    query = "INSERT INTO note VALUES (:id, :type)"
+    db_manager.execute_batch(query, [{"id": 1, "type": "Alert"}, {"id": 2, "type": "Call"}])
+    assert db_manager.execute_query("SELECT id, type FROM note") == [(1, "Alert"), (2, "Call")]
+    assert db_manager.statement(query) is db_manager.statement(query)
+
+def test_execute_concurrent(db_manager, tmp_path):
+    db_manager.engine = create_engine(f"sqlite:///{tmp_path / 'notes.db'}")
+    db_manager.execute_query("CREATE TABLE note (id INTEGER)")
+    db_manager.execute_query("INSERT INTO note VALUES (1), (2)")
+    result = db_manager.execute_concurrent(
+        ["SELECT COUNT(*) FROM note", "SELECT MAX(id) FROM note WHERE id < :id"], {"id": 2}
+    )
+    assert result == [[(2,)], [(1,)]]
 
 @patch("pandas.read_sql")
 def test_read_sql(mock_read_sql, db_manager):
@@ -43,16 +102,54 @@ def test_read_sql(mock_read_sql, db_manager):
 
 @patch("pandas.DataFrame.to_sql")
 def test_to_sql(mock_to_sql, db_manager):
-    mock_df = MagicMock()
-    db_manager.engine = create_engine(URL.create("sqlite:///:memory:"))
-    db_manager.to_sql(mock_df, "table")
+    df = pd.DataFrame({"id": [1]})
+    db_manager.engine = create_engine("sqlite://")
+    db_manager.to_sql(df, "table")
     mock_to_sql.assert_called_once_with(
-        "table", db_manager.engine, if_exists="fail", index=False
+        "table",
+        db_manager.engine,
+        if_exists="fail",
+        index=False,
+        chunksize=10000,
+        method=None,
     )
 
-@patch("sqlalchemy.engine.Engine.dispose")
-def test_close(mock_dispose, db_manager):
+def test_close(db_manager):
     mock_engine = MagicMock()
     db_manager.engine = mock_engine
     db_manager.close()
-    mock_dispose.assert_called_once()
+    mock_engine.dispose.assert_not_called()
+
+def test_close_drops_engine(db_manager):
+    db_manager.engine = create_engine("sqlite://")
+    db_manager.session = sessionmaker(bind=db_manager.engine)
+    db_manager.close()
+    assert db_manager.engine is None
+    assert db_manager.session is None
+    with pytest.raises(Exception, match="not established"):
+        db_manager.execute_query("SELECT 1")
+
+def test_read_sql_pyarrow_backend(db_manager):
+    db_manager.engine = create_engine("sqlite://")
+    result = db_manager.read_sql("SELECT 1 AS id, 'a' AS name", dtype_backend="pyarrow")
+    assert str(result["id"].dtype) == "int64[pyarrow]"
+    assert str(result["name"].dtype) == "string[pyarrow]"
+
+def test_read_sql_iter(db_manager):
+    db_manager.engine = create_engine("sqlite://")
+    db_manager.execute_many(
+        [
+            "CREATE TABLE reading (id INTEGER)",
+            "INSERT INTO reading VALUES (1), (2), (3)",
+        ]
+    )
+    chunks = list(db_manager.read_sql_iter("SELECT id FROM reading", chunksize=2))
+    assert [chunk["id"].tolist() for chunk in chunks] == [[1, 2], [3]]
+
+def test_to_sql_chunked(db_manager):
+    db_manager.engine = create_engine("sqlite://")
+    df = pd.DataFrame({"id": range(5), "type": ["Alert"] * 5})
+    db_manager.to_sql(df, "note", if_exists="replace", chunksize=2)
+    db_manager.to_sql(df, "note", if_exists="replace", chunksize=2)
+    result = db_manager.execute_query("SELECT id FROM note ORDER BY id")
+    assert [row[0] for row in result] == [0, 1, 2, 3, 4]
@@ -0,0 +1,53 @@
+import logging
+import pytest
+import pandas as pd
+from datetime import datetime
+from medicare_rebuild.helpers import pipeline_cache
+
+
+class Importer:
+    def __init__(self, cache_dir, use_cache=True):
+        self.start_date = datetime(2024, 1, 1)
+        self.end_date = datetime(2024, 1, 31)
+        self.cache_dir = cache_dir
+        self.use_cache = use_cache
+        self.logger = logging.getLogger(__name__)
+        self.calls = 0
+        self.snaps = 0
+
+    @pipeline_cache
+    def get_data(self, snap: bool = False) -> pd.DataFrame:
+        self.calls += 1
+        if snap:
+            self.snaps += 1
+        return pd.DataFrame({"id": [1, 2], "name": ["a", "b"]})
+
+
+@pytest.fixture
+def importer(tmp_path):
+    return Importer(tmp_path / "cache")
+
+
+def test_pipeline_cache_miss_and_hit(importer):
+    first = importer.get_data()
+    assert importer.calls == 1
+    assert len(list(importer.cache_dir.glob("get_data_*.parquet"))) == 1
+    second = importer.get_data()
+    assert importer.calls == 1
+    pd.testing.assert_frame_equal(first, second)
+
+
+def test_pipeline_cache_snap_runs_method(importer):
+    importer.get_data()
+    importer.get_data(snap=True)
+    importer.get_data(True)
+    assert importer.calls == 3
+    assert importer.snaps == 2
+
+
+def test_pipeline_cache_disabled(tmp_path):
+    importer = Importer(tmp_path / "cache", use_cache=False)
+    importer.get_data()
+    importer.get_data()
+    assert importer.calls == 2
+    assert not importer.cache_dir.exists()
@@ -1,10 +1,128 @@
+import time
 import logging
+import threading
 import requests
-from typing import List
-from datetime import datetime
+from collections import OrderedDict
+from typing import Dict, Iterable, Iterator, List
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime, timedelta
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Connection pools are shared by every session with the same pool sizes, keyed by (pool_connections, pool_maxsize).
+_http_adapters: Dict[tuple, HTTPAdapter] = {}
+_http_adapters_lock = threading.Lock()
+
+# Graph access tokens shared by clients of the same application, keyed by (tenant_id, client_id).
+_access_tokens: Dict[tuple, tuple] = {}
+_access_tokens_lock = threading.Lock()
+
+
+def parse_json(response: requests.Response, mime_params: str) -> dict:
+    """
+    Decode a JSON body, with orjson when it is installed.
+
+    Args:
+        response (requests.Response): The successful response.
+        mime_params (str): Parameters after the MIME type in the Content-Type header.
+
+    Returns:
+        dict: JSON serialized response body.
+    """
+    if orjson:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def parse_html(response: requests.Response, mime_params: str) -> str:
+    """
+    Decode an HTML body, as UTF-8 when the response has no charset.
+
+    Args:
+        response (requests.Response): The successful response.
+        mime_params (str): Parameters after the MIME type in the Content-Type header.
+
+    Returns:
+        str: The decoded response body.
+    """
+    # Without a charset requests falls back to ISO-8859-1, the APIs send UTF-8.
+    if "charset=" not in mime_params.lower():
+        response.encoding = "utf-8"
+    return response.text
+
+
+def parse_content(response: requests.Response, mime_params: str) -> bytes:
+    """
+    Return the raw body for any other content type.
+
+    Args:
+        response (requests.Response): The successful response.
+        mime_params (str): Parameters after the MIME type in the Content-Type header.
+
+    Returns:
+        bytes: The response body.
+    """
+    return response.content
+
+
+# Response parsers keyed by MIME type, the Content-Type header is split once per response.
+content_parsers = {"application/json": parse_json, "text/html": parse_html}
+
+
+def freeze(value):
+    """
+    Convert request arguments to a hashable form, dicts become sorted item tuples and lists become tuples.
+
+    Args:
+        value (Any): Request argument such as URL parameters.
+
+    Returns:
+        Any: The hashable form of the value.
+    """
+    if isinstance(value, dict):
+        return tuple(sorted((key, freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    return value
+
+
+def request_key(*args) -> tuple | None:
+    """
+    Build a cache key from request arguments.
+
+    Args:
+        *args: Request arguments such as the endpoint and URL parameters.
+
+    Returns:
+        tuple: The key, or None if an argument can't be hashed.
+    """
+    try:
+        key = tuple(freeze(arg) for arg in args)
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+class ThrottleRetry(Retry):
+    """
+    Retry policy that only replays a POST when it was throttled with a 429, other error statuses retry idempotent methods.
+    Connection errors are retried for every method, the request never reached the server.
+    """
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if method.upper() == "POST" and status_code == 429:
+            return super().is_retry("GET", status_code, has_retry_after)
+        return super().is_retry(method, status_code, has_retry_after)
+
 
 class RestAdapter:
     """
@@ -16,24 +134,38 @@ class RestAdapter:
         auth (Any): Authentication information (optional).
         proxies (dict): Dictionary of proxy addresses for HTTP(s) (optional).
         logger (Logger): Custom logger object (optional).
+        session (requests.Session): Existing session to share its connection pools (optional).
+        pool_connections (int): Number of hosts to keep connection pools for. Defaults to 50 (optional).
+        pool_maxsize (int): Connections kept per host, the limit that matters for single host APIs. Defaults to 50 (optional).
+        enable_cache (bool): Cache successful GET responses by endpoint and parameters, revalidating expired ones with ETag or Last-Modified. Defaults to False (optional).
+        cache_ttl (int): Seconds a cached GET response stays valid. Defaults to 300 (optional).
+        cache_size (int): Maximum number of cached GET responses, least recently used are evicted. Defaults to 1024 (optional).
     """
 
     def __init__(
         self,
         base_url: str = "",
-        headers: dict = {},
+        headers: dict = None,
         auth=None,
-        proxies: dict = {},
+        proxies: dict = None,
         logger=None,
+        session: requests.Session = None,
+        pool_connections: int = 50,
+        pool_maxsize: int = 50,
+        enable_cache: bool = False,
+        cache_ttl: int = 300,
+        cache_size: int = 1024,
     ):
         self.base_url = base_url
         self.logger = logger or logging.getLogger(__name__)
-
-        self.session = requests.Session()
-        retry = Retry(connect=3, backoff_factor=0.5)
-        adapter = HTTPAdapter(max_retries=retry)
-        self.session.mount("http://", adapter)
-        self.session.mount("https://", adapter)
+        self.cache = OrderedDict() if enable_cache else None
+        self.cache_ttl = cache_ttl
+        self.cache_size = cache_size
+        self._cache_lock = threading.Lock()
+        self._inflight: Dict[tuple, Future] = {}
+        self._inflight_lock = threading.Lock()
+
+        self.session = session or self.create_session(pool_connections, pool_maxsize)
         if headers:
             self.session.headers.update(headers)
         if auth:
@@ -41,32 +173,78 @@ class RestAdapter:
         if proxies:
             self.session.proxies.update(proxies)
 
-    def _send_request(
+    @staticmethod
+    def create_session(
+        pool_connections: int = 50, pool_maxsize: int = 50
+    ) -> requests.Session:
+        """
+        Create a session with retries and connection pools sized for concurrent requests.
+        Sessions keep their own headers and auth, but share the connection pools of sessions with the same sizes.
+
+        Args:
+            pool_connections (int): Number of hosts to keep connection pools for. Defaults to 50 (optional).
+            pool_maxsize (int): Connections kept per host. Defaults to 50 (optional).
+
+        Returns:
+            requests.Session: The configured session.
+        """
+        session = requests.Session()
+        key = (pool_connections, pool_maxsize)
+        with _http_adapters_lock:
+            adapter = _http_adapters.get(key)
+            if adapter is None:
+                retry = ThrottleRetry(
+                    total=5,
+                    connect=3,
+                    read=3,
+                    status=5,
+                    backoff_factor=0.5,
+                    backoff_jitter=0.25,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=frozenset(["GET", "PUT", "DELETE"]),
+                    respect_retry_after_header=True,
+                    raise_on_status=False,
+                )
+                adapter = HTTPAdapter(
+                    pool_connections=pool_connections,
+                    pool_maxsize=pool_maxsize,
+                    max_retries=retry,
+                )
+                _http_adapters[key] = adapter
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def _request(
         self,
         method: str,
         endpoint: str,
-        params: dict = {},
-        data: dict = {},
-        cookies: dict = {},
+        params: dict = None,
+        data: dict = None,
+        json: dict = None,
+        cookies: dict = None,
         verify: bool | str = None,
         timeout: int = None,
         allow_redirects: bool = True,
-    ) -> dict | str:
+        headers: dict = None,
+    ) -> requests.Response:
         """
-        Prepare the request to be sent. Send the prepared request and return the response.
+        Send the request through the session. Errors are logged rather than raised.
 
         Args:
             method (str): HTTP method ('GET', 'POST', etc.).
             endpoint (str): API endpoint (e.g., '/users', '/posts').
-            params (dict): URL parameters, defaults to empty dictionary (optional).
-            data (dict): Data sent in the request body, defaults to empty dictionary (optional).
-            cookies (dict): Cookie data in the request, defaults to empty dictionary (optional).
+            params (dict): URL parameters, defaults to None (optional).
+            data (dict): Data sent in the request body, defaults to None (optional).
+            json (dict): JSON serializable data sent as the request body, defaults to None (optional).
+            cookies (dict): Cookie data in the request, defaults to None (optional).
             verify (bool, str): Boolean whether to enforce SSL authentication, or supply a certificate to use. Defaults to None (optional).
             timeout (int): Number of seconds to wait for a response. Defaults to None (optional).
             allow_redirects (bool): Allow HTTP redirects to different URLs. Defaults to True (optional).
+            headers (dict): Headers added to this request only, defaults to None (optional).
 
         Returns:
-            (dict | str): JSON serialized response body or None if an error occurs.
+            requests.Response: The successful response or None if an error occurs.
 
         Raises:
             requests.exceptions.HTTPError: An HTTP error occurred.
@@ -74,34 +252,24 @@ class RestAdapter:
             requests.exceptions.Timeout: A timeout error occurred.
             requests.exceptions.RequestException: An unexpected error occurred.
         """
-        self.logger.debug(f"Request [{method}] - {self.base_url} {endpoint}")
+        self.logger.debug("Request [%s] - %s %s", method, self.base_url, endpoint)
         url = self.base_url + endpoint
-        req = requests.Request(
-            method,
-            url,
-            headers=self.session.headers,
-            params=params,
-            data=data,
-            cookies=cookies,
-        )
-        prep_req = self.session.prepare_request(req)
         try:
-            response = self.session.send(
-                prep_req,
+            response = self.session.request(
+                method,
+                url,
+                params=params,
+                data=data,
+                json=json,
+                cookies=cookies,
+                headers=headers,
                 verify=verify,
                 timeout=timeout,
                 allow_redirects=allow_redirects,
             )
             response.raise_for_status()
-            self.logger.debug(f"Status [{response.status_code}] - {response.reason}")
-            if response:
-                content_type = response.headers.get("Content-Type", "").lower()
-                if "application/json" in content_type:
-                    return response.json()
-                elif "text/html" in content_type:
-                    return response.text
-                else:
-                    return response.content
+            self.logger.debug("Status [%s] - %s", response.status_code, response.reason)
+            return response
         except requests.exceptions.HTTPError as errh:
             self.logger.error(f"HTTP Error: {errh}")
         except requests.exceptions.ConnectionError as errc:
@@ -111,43 +279,179 @@ class RestAdapter:
         except requests.exceptions.RequestException as err:
             self.logger.error(f"An Unexpected Error: {err}")
 
-    def get(
+    def _parse_response(self, response: requests.Response) -> dict | str:
+        """
+        Parse the response body by its content type.
+
+        Args:
+            response (requests.Response): The successful response.
+
+        Returns:
+            (dict | str): JSON serialized response body or None if the body can't be decoded.
+        """
+        mime, _, mime_params = response.headers.get("Content-Type", "").partition(";")
+        parse = content_parsers.get(mime.strip().lower(), parse_content)
+        try:
+            return parse(response, mime_params)
+        except ValueError as err:
+            self.logger.error(f"An Unexpected Error: {err}")
+
+    def _send_request(
         self,
+        method: str,
         endpoint: str,
         params: dict = None,
+        data: dict = None,
+        json: dict = None,
         cookies: dict = None,
         verify: bool | str = None,
         timeout: int = None,
         allow_redirects: bool = True,
-    ) -> dict:
+    ) -> dict | str:
         """
-        Make a GET request.
+        Send the request through the session and return the response.
 
         Args:
-            endpoint (str): API endpoint.
-            params (dict): URL parametersm, defaults to None (optional).
+            method (str): HTTP method ('GET', 'POST', etc.).
+            endpoint (str): API endpoint (e.g., '/users', '/posts').
+            params (dict): URL parameters, defaults to None (optional).
+            data (dict): Data sent in the request body, defaults to None (optional).
+            json (dict): JSON serializable data sent as the request body, defaults to None (optional).
             cookies (dict): Cookie data in the request, defaults to None (optional).
             verify (bool, str): Boolean whether to enforce SSL authentication, or supply a certificate to use. Defaults to None (optional).
             timeout (int): Number of seconds to wait for a response. Defaults to None (optional).
             allow_redirects (bool): Allow HTTP redirects to different URLs. Defaults to True (optional).
 
         Returns:
-            dict: JSON serialized response body or None if an error occurs.
+            (dict | str): JSON serialized response body or None if an error occurs.
         """
-        return self._send_request(
-            "GET",
+        response = self._request(
+            method,
             endpoint,
             params=params,
+            data=data,
+            json=json,
             cookies=cookies,
             verify=verify,
             timeout=timeout,
             allow_redirects=allow_redirects,
         )
+        if response is not None:
+            return self._parse_response(response)
+
+    def get(
+        self,
+        endpoint: str,
+        params: dict = None,
+        cookies: dict = None,
+        verify: bool | str = None,
+        timeout: int = None,
+        allow_redirects: bool = True,
+    ) -> dict:
+        """
+        Make a GET request. Served from the cache when caching is enabled and a fresh response is stored.
+        Expired responses with an ETag or Last-Modified header are revalidated with a conditional request.
+        Concurrent calls with the same endpoint, parameters and request options share a single request.
+
+        Args:
+            endpoint (str): API endpoint.
+            params (dict): URL parametersm, defaults to None (optional).
+            cookies (dict): Cookie data in the request, defaults to None (optional).
+            verify (bool, str): Boolean whether to enforce SSL authentication, or supply a certificate to use. Defaults to None (optional).
+            timeout (int): Number of seconds to wait for a response. Defaults to None (optional).
+            allow_redirects (bool): Allow HTTP redirects to different URLs. Defaults to True (optional).
+
+        Returns:
+            dict: JSON serialized response body or None if an error occurs.
+        """
+        key = request_key(endpoint, params, cookies, verify, timeout, allow_redirects)
+        if key is None:
+            return self._get(
+                endpoint,
+                params=params,
+                cookies=cookies,
+                verify=verify,
+                timeout=timeout,
+                allow_redirects=allow_redirects,
+            )
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            leader = future is None
+            if leader:
+                future = self._inflight[key] = Future()
+        if not leader:
+            return future.result()
+        try:
+            res = self._get(
+                endpoint,
+                params=params,
+                cookies=cookies,
+                verify=verify,
+                timeout=timeout,
+                allow_redirects=allow_redirects,
+            )
+            future.set_result(res)
+            return res
+        except BaseException as err:
+            future.set_exception(err)
+            raise
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _get(self, endpoint: str, **kwargs) -> dict:
+        """
+        Make a GET request through the cache when caching is enabled.
+        Requests with parameters that can't be hashed skip the cache.
+
+        Args:
+            endpoint (str): API endpoint.
+            **kwargs: Request arguments passed on to the session.
+
+        Returns:
+            dict: JSON serialized response body or None if an error occurs.
+        """
+        key = None
+        if self.cache is not None:
+            key = request_key(endpoint, kwargs.get("params"))
+        if key is None:
+            return self._send_request("GET", endpoint, **kwargs)
+        with self._cache_lock:
+            cached = self.cache.get(key)
+            if cached and cached[0] > time.monotonic():
+                self.cache.move_to_end(key)
+                return cached[1]
+        validators = cached[2] if cached else {}
+        response = self._request("GET", endpoint, headers=validators, **kwargs)
+        # Failed requests return None and are never cached.
+        if response is None:
+            return None
+        if response.status_code == 304 and cached:
+            res = cached[1]
+        else:
+            res = self._parse_response(response)
+            if res is None:
+                return None
+        validators = {
+            header: response.headers[source]
+            for header, source in [
+                ("If-None-Match", "ETag"),
+                ("If-Modified-Since", "Last-Modified"),
+            ]
+            if source in response.headers
+        } or validators
+        with self._cache_lock:
+            self.cache[key] = (time.monotonic() + self.cache_ttl, res, validators)
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+        return res
 
     def post(
         self,
         endpoint: str,
         data: dict = None,
+        json: dict = None,
         params: dict = None,
         cookies: dict = None,
         verify: bool | str = None,
@@ -160,6 +464,7 @@ class RestAdapter:
         Args:
             endpoint (str): API endpoint.
             data (dict): Data sent in the request body, defaults to None (optional).
+            json (dict): JSON serializable data sent as the request body, defaults to None (optional).
             params (dict): URL parametersm, defaults to None (optional).
             cookies (dict): Cookie data in the request, defaults to None (optional).
             verify (bool, str): Boolean whether to enforce SSL authentication, or supply a certificate to use. Defaults to None (optional).
@@ -173,6 +478,7 @@ class RestAdapter:
             "POST",
             endpoint,
             data=data,
+            json=json,
             params=params,
             cookies=cookies,
             verify=verify,
@@ -184,6 +490,7 @@ class RestAdapter:
         self,
         endpoint: str,
         data: dict = None,
+        json: dict = None,
         params: dict = None,
         cookies: dict = None,
         verify: bool | str = None,
@@ -196,6 +503,7 @@ class RestAdapter:
         Args:
             endpoint (str): API endpoint.
             data (dict): Data sent in the request body, defaults to None (optional).
+            json (dict): JSON serializable data sent as the request body, defaults to None (optional).
             params (dict): URL parametersm, defaults to None (optional).
             cookies (dict): Cookie data in the request, defaults to None (optional).
             verify (bool, str): Boolean whether to enforce SSL authentication, or supply a certificate to use. Defaults to None (optional).
@@ -209,6 +517,7 @@ class RestAdapter:
             "PUT",
             endpoint,
             data=data,
+            json=json,
             params=params,
             cookies=cookies,
             verify=verify,
@@ -259,46 +568,154 @@ class MSGraphApi:
         client_id (str): The client ID for the Azure AD application.
         client_secret (str): The client secret for the Azure AD application.
         logger (Logger): Custom logger object (optional).
+        session (requests.Session): Existing session to share its connection pools (optional).
     """
 
-    def __init__(self, tenant_id: str, client_id: str, client_secret: str, logger=None):
+    def __init__(
+        self,
+        tenant_id: str,
+        client_id: str,
+        client_secret: str,
+        logger=None,
+        session: requests.Session = None,
+    ):
         self.logger = logger or logging.getLogger(__name__)
         self.tenant_id = tenant_id
         self.client_id = (client_id,)
         self.client_secret = client_secret
+        self.token_expires = None
+        self.rest = RestAdapter(
+            "https://graph.microsoft.com/v1.0", logger=self.logger, session=session
+        )
 
     def request_access_token(
         self,
     ) -> None:
         """
         Uses tenant ID, client ID, and client secret to request an access token with privileges outlined in the application object.
+        Tokens are shared between clients of the same application and reused until five minutes before they expire.
         """
-        rest = RestAdapter("https://login.microsoftonline.com", logger=self.logger)
-        data = {
-            "grant_type": "client_credentials",
-            "client_id": self.client_id,
-            "client_secret": self.client_secret,
-            "scope": "https://graph.microsoft.com/.default",
-        }
-        res = rest.post(f"/{self.tenant_id}/oauth2/v2.0/token", data=data)
-        access_token = res.get("access_token")
-        headers = {"Authorization": f"Bearer {access_token}"}
-        self.rest = RestAdapter(
-            "https://graph.microsoft.com/v1.0", headers=headers, logger=self.logger
+        key = (self.tenant_id, self.client_id)
+        # Holding the lock during the request keeps concurrent clients from all fetching a token.
+        with _access_tokens_lock:
+            cached = _access_tokens.get(key)
+            if cached and cached[1] - datetime.now() >= timedelta(minutes=5):
+                access_token, self.token_expires = cached
+            else:
+                # The token request shares the Graph session, so refreshes reuse its connections.
+                rest = RestAdapter(
+                    "https://login.microsoftonline.com",
+                    logger=self.logger,
+                    session=self.rest.session,
+                )
+                self.rest.session.headers.pop("Authorization", None)
+                data = {
+                    "grant_type": "client_credentials",
+                    "client_id": self.client_id,
+                    "client_secret": self.client_secret,
+                    "scope": "https://graph.microsoft.com/.default",
+                }
+                res = rest.post(f"/{self.tenant_id}/oauth2/v2.0/token", data=data)
+                access_token = res.get("access_token")
+                self.token_expires = datetime.now() + timedelta(
+                    seconds=int(res.get("expires_in", 3599))
+                )
+                _access_tokens[key] = (access_token, self.token_expires)
+        self.rest.session.headers["Authorization"] = f"Bearer {access_token}"
+
+    def batch(self, batch_requests: List[dict], retries: int = 3) -> Dict[str, dict]:
+        """
+        Send requests through the JSON batching endpoint, 20 requests per call.
+        Throttled or server error responses are sent again after their Retry-After delay.
+
+        Args:
+            batch_requests (List[dict]): Requests with 'id', 'method' and 'url' relative to the API version.
+            retries (int): Number of times failed requests are sent again. Defaults to 3 (optional).
+
+        Returns:
+            Dict[str, dict]: Response bodies keyed by request ID, or None if a request fails.
+        """
+        results = {}
+        pending = batch_requests
+        for attempt in range(retries + 1):
+            failed, delay = [], 0.0
+            requests_by_id = {request["id"]: request for request in pending}
+            for start in range(0, len(pending), 20):
+                res = self.rest.post(
+                    "/$batch", json={"requests": pending[start : start + 20]}
+                )
+                if not res:
+                    self.logger.error("Batch request failed")
+                    return None
+                for response in res.get("responses", []):
+                    status = response.get("status", 500)
+                    if status == 429 or status >= 500:
+                        failed.append(requests_by_id[response["id"]])
+                        retry_after = response.get("headers", {}).get("Retry-After")
+                        delay = max(delay, float(retry_after or 2**attempt))
+                    elif status >= 400:
+                        self.logger.error(
+                            f"Batch request {response.get('id')} failed with status {status}"
+                        )
+                        return None
+                    else:
+                        results[response["id"]] = response.get("body", {})
+            if not failed:
+                return results
+            pending = failed
+            if attempt < retries:
+                self.logger.warning(
+                    f"Retrying {len(failed)} batch requests in {delay} seconds"
+                )
+                time.sleep(delay)
+        self.logger.error(
+            f"Batch requests {[request['id'] for request in pending]} failed after {retries} retries"
         )
+        return None
+
+    def get_many_group_members(self, group_ids: List[str]) -> Dict[str, List[dict]]:
+        """
+        Get all members of several groups, batching the requests and following every page.
+
+        Args:
+            group_ids (List[str]): GUIDs of the desired groups.
+
+        Returns:
+            Dict[str, List[dict]]: Group members keyed by group ID, or None if a request fails.
+        """
+        members = {group_id: [] for group_id in group_ids}
+        pending = {group_id: f"/groups/{group_id}/members" for group_id in members}
+        while pending:
+            results = self.batch(
+                [
+                    {"id": group_id, "method": "GET", "url": url}
+                    for group_id, url in pending.items()
+                ]
+            )
+            if results is None:
+                return None
+            pending = {}
+            for group_id, body in results.items():
+                members[group_id].extend(body.get("value", []))
+                next_link = body.get("@odata.nextLink")
+                if next_link:
+                    pending[group_id] = next_link.removeprefix(self.rest.base_url)
+        return members
 
     def get_group_members(self, group_id: str) -> dict:
         """
-        Get all members that belong to a specific group.
+        Get all members that belong to a specific group, following every page.
 
         Args:
             group_id (str): GUID of the desired group.
 
         Returns:
-            dict: JSON serialized response body or None if an error occurs.
+            dict: The group members under 'value', or None if a request fails.
         """
-        endpoint = f"/groups/{group_id}/members"
-        return self.rest.get(endpoint)
+        members = self.get_many_group_members([group_id])
+        if members is None:
+            return None
+        return {"value": members[group_id]}
 
 
 class TenoviApi:
@@ -340,7 +757,7 @@ class TenoviApi:
         Args:
             hwi_device_id (str): The hardware ID of the device.
             metric (str): The name of the metric data to filter by (optional).
-            created_gte (datetime, str): The earliest creation date to filter by (optional).
+            created_gte (datetime, str): The earliest creation date to filter by, strings are passed through as formatted (optional).
 
         Returns:
             List[dict]: List of readings.
@@ -350,8 +767,64 @@ class TenoviApi:
             params["metric__name"] = metric
         if created_gte:
             if not isinstance(created_gte, str):
-                created_gte = created_gte.strftime("%Y-%m-%dT%H:%M:%SZ")
+                created_gte = (
+                    created_gte.replace(microsecond=0, tzinfo=None).isoformat() + "Z"
+                )
             params["created__gte"] = created_gte
         return self.rest.get(
             f"/hwi/hwi-devices/{hwi_device_id}/measurements/", params=params
         )
+
+    def get_readings_stream(
+        self, hwi_device_id: str, metric: str = "", created_gte: datetime | str = None
+    ) -> Iterator[dict]:
+        """
+        Yield readings for a specific device one page at a time, following pagination links.
+
+        Args:
+            hwi_device_id (str): The hardware ID of the device.
+            metric (str): The name of the metric data to filter by (optional).
+            created_gte (datetime, str): The earliest creation date to filter by (optional).
+
+        Yields:
+            dict: A single reading.
+        """
+        page = self.get_readings(hwi_device_id, metric=metric, created_gte=created_gte)
+        while page:
+            if not isinstance(page, dict):
+                yield from page
+                return
+            yield from page.get("results", [])
+            next_url = page.get("next")
+            if not next_url:
+                return
+            page = self.rest.get(next_url.removeprefix(self.rest.base_url))
+
+    def get_readings_many(
+        self,
+        hwi_device_ids: Iterable[str],
+        metric: str = "",
+        created_gte: datetime | str = None,
+        max_workers: int = 50,
+    ) -> List[List[dict]]:
+        """
+        Get readings for many devices concurrently.
+
+        Args:
+            hwi_device_ids (Iterable[str]): The hardware IDs of the devices.
+            metric (str): The name of the metric data to filter by (optional).
+            created_gte (datetime, str): The earliest creation date to filter by (optional).
+            max_workers (int): Maximum number of concurrent requests, matched to the connection pool size. Defaults to 50 (optional).
+
+        Returns:
+            List[List[dict]]: List of readings for each device, in the order given.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda hwi_device_id: self.get_readings(
+                        hwi_device_id, metric=metric, created_gte=created_gte
+                    ),
+                    hwi_device_ids,
+                )
+            )
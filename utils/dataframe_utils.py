@@ -1,7 +1,13 @@
+import os
 import re
 import html
+import functools
+import multiprocessing
 import pandas as pd
 import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+from concurrent.futures import ProcessPoolExecutor
 
 from utils.enums import (
     insurance_keywords,
@@ -11,8 +17,23 @@ from utils.enums import (
 )
 
 
+@functools.lru_cache(maxsize=None)
+def compile_keyword_pattern(keywords: tuple) -> re.Pattern:
+    """Compiles keywords into a single alternation pattern matching any keyword as a whole word.
+    Compiled patterns are cached, so each keyword set is compiled once.
+
+    Args:
+        keywords (tuple): The keywords to be matched.
+
+    Returns:
+        re.Pattern: The compiled keyword pattern.
+    """
+    return re.compile(r"\b(" + "|".join(map(re.escape, keywords)) + r")\b")
+
+
 def keyword_search(value: str, keywords: dict, keep_original=False) -> str:
     """Searches for a keyword being present in the value.
+    All keywords are found in one regex pass, the first match in dictionary order is used.
 
     Args:
         value (str): The value to be standardized.
@@ -22,8 +43,10 @@ def keyword_search(value: str, keywords: dict, keep_original=False) -> str:
     Returns:
         str: The standardized name, found as the key in the keyword list.
     """
+    pattern = compile_keyword_pattern(tuple(keywords.values()))
+    matches = set(pattern.findall(value.lower()))
     for standard_name, keyword in keywords.items():
-        if re.search(r"\b" + re.escape(keyword) + r"\b", value.lower()):
+        if keyword in matches:
             return standard_name
     return value if keep_original else np.nan
 
@@ -31,6 +54,7 @@ def keyword_search(value: str, keywords: dict, keep_original=False) -> str:
 def keyword_list_search(value: str, keywords: dict, keep_original=False) -> str:
     """Searches for a keyword being present in the value. Keywords are stored in lists of lists.
     All keywords must be present in the value to be considered True.
+    All keywords are found in one regex pass, the first match in dictionary order is used.
 
     Args:
         value (str): The value to be standardized.
@@ -40,12 +64,18 @@ def keyword_list_search(value: str, keywords: dict, keep_original=False) -> str:
     Returns:
         str: The standardized name, found as the key in the keyword list.
     """
+    all_keywords = tuple(
+        dict.fromkeys(
+            keyword
+            for keyword_sets in keywords.values()
+            for keyword_set in keyword_sets
+            for keyword in keyword_set
+        )
+    )
+    matches = set(compile_keyword_pattern(all_keywords).findall(value.lower()))
     for standard_name, keyword_sets in keywords.items():
         for keyword_set in keyword_sets:
-            if all(
-                re.search(r"\b" + re.escape(keyword) + r"\b", value.lower())
-                for keyword in keyword_set
-            ):
+            if all(keyword in matches for keyword in keyword_set):
                 return standard_name
     return value if keep_original else np.nan
 
@@ -67,91 +97,240 @@ def extract_regex_pattern(value: str, pattern: re.Pattern, keep_original=False)
     return value if keep_original else np.nan
 
 
+def null_nan_text(col: pd.Series, sentinels: tuple = ("nan",)) -> pd.Series:
+    """Replaces 'nan' text left behind by string conversion with a null value.
+
+    Args:
+        col (pandas.Series): The values to be checked.
+        sentinels (tuple): Lowercase texts to be nulled. Defaults to ('nan',) (optional).
+
+    Returns:
+        pandas.Series: The values with 'nan' text, in any case, replaced by NaN.
+    """
+    return col.mask(col.astype(str).str.lower().isin(sentinels))
+
+
+def null_nan_columns(df: pd.DataFrame, sentinels: tuple = ("nan",)) -> pd.DataFrame:
+    """Replaces 'nan' text with a null value in the text and categorical columns.
+    Numeric and datetime columns can't hold the text, so they are skipped.
+
+    Args:
+        df (pandas.DataFrame): Dataframe to be checked.
+        sentinels (tuple): Lowercase texts to be nulled. Defaults to ('nan',) (optional).
+
+    Returns:
+        pandas.DataFrame: The dataframe with 'nan' text replaced by NaN.
+    """
+    for col in df.select_dtypes(include=["object", "string", "category"]).columns:
+        df[col] = null_nan_text(df[col], sentinels)
+    return df
+
+
+def to_arrow_text(col: pd.Series) -> pd.Series:
+    """Converts values to Arrow-backed strings, so string methods run as pyarrow compute kernels.
+    Null values become 'nan' text, the same as converting to str.
+    Regex methods only use the Arrow kernels when given pattern text, compiled patterns fall back to Python.
+
+    Args:
+        col (pandas.Series): The values to be converted.
+
+    Returns:
+        pandas.Series: The values as string[pyarrow].
+    """
+    return col.astype(str).astype("string[pyarrow]")
+
+
+def strip_title(col: pd.Series) -> pd.Series:
+    """Trims whitespace and titles the text with pyarrow compute kernels, without an intermediate Series.
+    Null values become 'Nan' text, the same as converting to str and titling.
+
+    Args:
+        col (pandas.Series): The values to be converted.
+
+    Returns:
+        pandas.Series: The trimmed and titled values as string[pyarrow].
+    """
+    text = pa.array(col.astype(str), type=pa.string())
+    text = pc.utf8_title(pc.utf8_trim_whitespace(text))
+    return pd.Series(pd.arrays.ArrowStringArray(text), index=col.index)
+
+
+def apply_unique(values: pd.Series | pd.DataFrame, func) -> pd.Series:
+    """Applies a function once per unique value, then maps the results back onto every row.
+    Dataframe values are applied once per unique row, each row is passed as a series.
+
+    Args:
+        values (pandas.Series, pandas.DataFrame): The values to be transformed.
+        func (Callable): The function applied to each unique value or row.
+
+    Returns:
+        pandas.Series: The function results, aligned to the original index.
+    """
+    if values.empty:
+        return pd.Series(index=values.index, dtype=object)
+    if isinstance(values, pd.DataFrame):
+        codes, uniques = pd.MultiIndex.from_frame(values).factorize()
+        uniques = [pd.Series(row, index=values.columns) for row in uniques]
+    else:
+        codes, uniques = pd.factorize(values, use_na_sentinel=False)
+    results = np.empty(len(uniques), dtype=object)
+    results[:] = [func(value) for value in uniques]
+    return pd.Series(results[codes], index=values.index)
+
+
+def normalize_in_chunks(
+    df: pd.DataFrame, normalize, max_workers: int = None, min_chunk_rows: int = 50000
+) -> pd.DataFrame:
+    """Runs a row-wise normalize function over chunks of the dataframe in worker processes.
+    Dataframes too small to fill two chunks are normalized in the current process.
+    Categorical columns are restored after the chunks are joined.
+
+    Args:
+        df (pandas.DataFrame): The dataframe to be normalized.
+        normalize (Callable): Module level normalize function, applied to each chunk.
+        max_workers (int): Maximum number of worker processes. Defaults to the CPU count (optional).
+        min_chunk_rows (int): Minimum number of rows per chunk. Defaults to 50000 (optional).
+
+    Returns:
+        pandas.DataFrame: The normalized dataframe.
+    """
+    max_workers = max_workers or os.cpu_count() or 1
+    n_chunks = min(max_workers, len(df) // min_chunk_rows)
+    if n_chunks < 2:
+        return normalize(df)
+    bounds = np.linspace(0, len(df), n_chunks + 1, dtype=int)
+    chunks = [df.iloc[start:stop] for start, stop in zip(bounds[:-1], bounds[1:])]
+    # Workers are spawned, the importer calls this from threads where forking is unsafe.
+    with ProcessPoolExecutor(
+        max_workers=n_chunks, mp_context=multiprocessing.get_context("spawn")
+    ) as executor:
+        results = list(executor.map(normalize, chunks))
+    categories = [
+        col for col, dtype in results[0].dtypes.items() if dtype == "category"
+    ]
+    df = pd.concat(results)
+    for col in categories:
+        df[col] = df[col].astype("category")
+    return df
+
+
 # --- Standardize Functions ---
 """
 Standardize functions are methods used to transform and clean data within a Pandas DataFrame.
 These functions take an initial input value, apply a transformation, and return a standardized output.
-The strength of these functions is in their ability to be applied to different dimensions of the DataFrame, such as Series, enabling efficient data preprocessing and consistency.
+Functions that take a Series run vectorized string operations over the whole column instead of calling Python once per row.
 """
 
-
-def standardize_name(name: str, pattern: str) -> str:
+email_pattern = re.compile(r"(^[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}$)")
+mbi_pattern = re.compile(r"([A-Z0-9]{11})")
+dx_code_pattern = re.compile(r"[EIR]\d+(?:\.\d+)?")
+insurance_id_pattern = re.compile(r"([A-Z]*\d+[A-Z]*\d+[A-Z]*\d+[A-Z]*\d*)")
+non_alnum_pattern = re.compile(r"[^A-Z0-9]")
+height_pattern = re.compile(r"^(\d+)\D*?(\d+)?\D*?$")
+height_unit_pattern = re.compile(r"['\"]|ft|in")
+weight_unit_pattern = re.compile(r"lbs|kg")
+html_tag_pattern = re.compile(r"<[^>]*>")
+whitespace_pattern = re.compile(r"\s+")
+non_digit_pattern = re.compile(r"\D")
+name_pattern = re.compile(r"[^a-zA-Z\s.-]")
+middle_name_pattern = re.compile(r"[^a-zA-Z-\s]")
+address_pattern = re.compile(r"[^a-zA-Z0-9\s#.-/]")
+city_pattern = re.compile(r"[^a-zA-Z-]")
+emcontact_name_pattern = re.compile(r"[^a-zA-Z\s.-/()]")
+state_lookup = {name.lower(): abbr for abbr, name in state_abbreviations.items()}
+
+
+def standardize_name(name: pd.Series, pattern: str | re.Pattern) -> pd.Series:
     """Standardizes strings from name-like texts.
     Trims whitespace and titles the text. Flattens remaining whitespace to one space.
     Uses inverse regex pattern to replace all unmatched characters with empty string.
 
     Args:
-        name (str): The value to be standardized.
-        pattern (str): The inverse pattern used in replacing unwanted characters.
+        name (pandas.Series): The values to be standardized.
+        pattern (str, re.Pattern): The inverse pattern used in replacing unwanted characters.
 
     Returns:
-        str: The standardized name text.
+        pandas.Series: The standardized name text.
     """
-    name = str(name).strip().title()
-    name = re.sub(r"\s+", " ", name)
-    name = re.sub(pattern, "", name)
-    return name
+    name = strip_title(name)
+    name = name.str.replace(whitespace_pattern.pattern, " ", regex=True)
+    return name.str.replace(getattr(pattern, "pattern", pattern), "", regex=True)
+
+
+def standardize_digits(digits: pd.Series) -> pd.Series:
+    """Standardizes number strings like phone and social security numbers.
+    Removes every character that isn't a digit.
+
+    Args:
+        digits (pandas.Series): The values to be standardized.
+
+    Returns:
+        pandas.Series: The digits of each value.
+    """
+    return to_arrow_text(digits).str.replace(non_digit_pattern.pattern, "", regex=True)
 
 
-def standardize_email(email: str) -> str:
+def standardize_email(email: pd.Series) -> pd.Series:
     """Standardizes email address strings.
     Trims whitespace and lowers the text. Regex matching attempts to find an email address and extracts it.
 
     Args:
-        email (str): The value to be standardized.
+        email (pandas.Series): The values to be standardized.
 
     Returns:
-        str: The standardized email address.
+        pandas.Series: The standardized email address, NaN where no address is found.
     """
-    email = str(email).strip().lower()
-    email_pattern = r"(^[a-z0-9._%+-]+@[a-z0-9.-]+\.[a-z]{2,}$)"
-    return extract_regex_pattern(email, email_pattern)
+    email = to_arrow_text(email).str.strip().str.lower()
+    return email.str.extract(email_pattern.pattern, expand=False)
 
 
-def standardize_state(state: str) -> str:
-    """Standardizes US state strings. Trims whitespace and titles the text.
-    Searches state's name and correlates that with the State's two letter abbreviation.
+def standardize_state(state: pd.Series) -> pd.Series:
+    """Standardizes US state strings. Trims whitespace and lowers the text.
+    Looks up the state's name and correlates that with the State's two letter abbreviation.
+    Values that are not a state name are kept, upper-cased.
 
     Args:
-        state (str): The value to be standardized.
+        state (pandas.Series): The values to be standardized.
 
     Returns:
-        str: The standardized US state abbreviation.
+        pandas.Series: The standardized US state abbreviations, as a categorical.
     """
-    state = str(state).strip().title()
-    return keyword_search(state, state_abbreviations, keep_original=True).upper()
+    state = state.astype(str).str.strip()
+    abbreviations = state.str.lower().map(state_lookup)
+    return abbreviations.fillna(state.str.upper()).astype("category")
 
 
-def standardize_mbi(mbi: str) -> str:
-    """Standardizes medicare beneficiary ID strings. Trims whitespace and lowers the text.
-    Regex matching attempts to find a medicare beneficiary ID and extracts it.
+def standardize_mbi(mbi: pd.Series) -> pd.Series:
+    """Standardizes medicare beneficiary ID strings. Trims whitespace and uppers the text.
+    Regex matching attempts to find a medicare beneficiary ID, ignoring hyphens, and extracts it.
 
     Args:
-        mbi (str): The value to be standardized.
+        mbi (pandas.Series): The values to be standardized.
 
     Returns:
-        str: The standardized medicare beneficiary ID.
+        pandas.Series: The standardized medicare beneficiary ID, or the trimmed text if no ID is found.
     """
-    mbi = str(mbi).strip().upper()
-    mbi_pattern = r"([A-Z0-9]{11})"
-    return extract_regex_pattern(mbi, mbi_pattern, keep_original=True)
+    mbi = to_arrow_text(mbi).str.strip().str.upper()
+    matches = mbi.str.replace("-", "", regex=False).str.extract(
+        mbi_pattern.pattern, expand=False
+    )
+    return matches.fillna(mbi)
 
 
-def standardize_dx_code(dx_code: str) -> str:
+def standardize_dx_code(dx_code: pd.Series) -> pd.Series:
     """Standardizes diagnosis codes.
     Trims whitespace and uppers the text. Searches text for regex pattern of diagnosis code.
     Joins all elements into a single string with commas as the separator.
 
     Args:
-        dx_code (str): The value to be standardized.
+        dx_code (pandas.Series): The values to be standardized.
 
     Returns:
-        str: string representation of the list of Dx codes.
+        pandas.Series: string representation of the list of Dx codes.
     """
-    dx_code = str(dx_code).strip().upper()
-    matches = re.finditer(r"[E|I|R]\d+(\.\d+)?", dx_code)
-    matches = [match.group(0).replace(".", "") for match in matches]
-    return ",".join(matches)
+    dx_code = dx_code.astype(str).str.strip().str.upper()
+    matches = dx_code.str.findall(dx_code_pattern).str.join(",")
+    return matches.str.replace(".", "", regex=False)
 
 
 def standardize_insurance_name(name: str) -> str:
@@ -168,74 +347,76 @@ def standardize_insurance_name(name: str) -> str:
     return keyword_list_search(name, insurance_keywords, keep_original=True)
 
 
-def standardize_insurance_id(ins_id: str) -> str:
+def standardize_insurance_id(ins_id: pd.Series) -> pd.Series:
     """Standardizes insurance ID strings. Trims whitespace and uppers the text.
     Any non-alphanumeric character is replaced with empty string.
     Regex matching attempts to find insurance IDs and extracts them.
 
     Args:
-        ins_id (str): The value to be standardized.
+        ins_id (pandas.Series): The values to be standardized.
 
     Returns:
-        str: The standardized insurance ID.
+        pandas.Series: The standardized insurance ID, or the trimmed text if no ID is found.
     """
-    ins_id = str(ins_id).strip().upper()
-    ins_id = re.sub(r"[^A-Z0-9]", "", ins_id)
-    id_pattern = r"([A-Z]*\d+[A-Z]*\d+[A-Z]*\d+[A-Z]*\d*)"
-    return extract_regex_pattern(ins_id, id_pattern, keep_original=True)
+    ins_id = to_arrow_text(ins_id).str.strip().str.upper()
+    cleaned = ins_id.str.replace(non_alnum_pattern.pattern, "", regex=True)
+    return cleaned.str.extract(insurance_id_pattern.pattern, expand=False).fillna(
+        ins_id
+    )
 
 
-def fill_primary_payer(row: pd.Series) -> pd.Series:
+def fill_primary_payer(df: pd.DataFrame) -> pd.Series:
     """Fills primary payer name with 'Medicare Part B'.
     If insurance name and insurance ID is null; and medicare beneficiary ID is not null.
     Then the primary payer name gets filled with 'Medicare Part B'.
 
     Args:
-        row (pandas.Series): Row of Dataframe to be standardized.
+        df (pandas.DataFrame): Dataframe to be standardized.
 
     Returns:
-        pandas.Series: The standardized row of Dataframe.
+        pandas.Series: The standardized primary payer names.
     """
-    row.replace(r"(?i)^nan$", np.nan, regex=True, inplace=True)
-    if (
-        pd.isnull(row["Insurance Name:"])
-        and pd.isnull(row["Insurance ID:"])
-        and not pd.isnull(row["Medicare ID number"])
-    ):
-        return "Medicare Part B"
-    return row["Insurance Name:"]
+    ins_name = null_nan_text(df["Insurance Name:"])
+    ins_id = null_nan_text(df["Insurance ID:"])
+    mbi = null_nan_text(df["Medicare ID number"])
+    conditions = [ins_name.isna() & ins_id.isna() & mbi.notna()]
+    payer = np.select(conditions, ["Medicare Part B"], default=ins_name.astype(object))
+    return pd.Series(payer, index=df.index)
 
 
-def fill_primary_payer_id(row: pd.Series) -> pd.Series:
+def fill_primary_payer_id(df: pd.DataFrame) -> pd.Series:
     """Fills primary payer ID with medicare beneficiary ID.
     If insurance name is 'Medicare Part B' and insurance ID is null.
     Then the primary payer ID gets filled with the medicare beneficiary ID.
 
     Args:
-        row (pandas.Series): Row of Dataframe to be standardized.
+        df (pandas.DataFrame): Dataframe to be standardized.
 
     Returns:
-        pandas.Series: The standardized row of Dataframe.
+        pandas.Series: The standardized primary payer IDs.
     """
-    row.replace(r"(?i)^nan$", np.nan, regex=True, inplace=True)
-    if row["Insurance Name:"] == "Medicare Part B" and pd.isnull(row["Insurance ID:"]):
-        return row["Medicare ID number"]
-    return row["Insurance ID:"]
+    ins_name = null_nan_text(df["Insurance Name:"])
+    ins_id = null_nan_text(df["Insurance ID:"])
+    mbi = null_nan_text(df["Medicare ID number"])
+    conditions = [(ins_name == "Medicare Part B") & ins_id.isna()]
+    payer_id = np.select(
+        conditions, [mbi.astype(object)], default=ins_id.astype(object)
+    )
+    return pd.Series(payer_id, index=df.index)
 
 
-def standardize_call_time(call_time) -> int:
+def standardize_call_time(call_time: pd.Series) -> pd.Series:
     """Standardizes call time in seconds.
-    Converts value to a timedelta object and then calculates total seconds.
+    Converts the values to timedeltas and then calculates total seconds. Empty or unparseable values become 0.
 
     Args:
-        call_time: The value to be standardized.
+        call_time (pandas.Series): The values to be standardized.
 
     Returns:
-        int: The standardized call time in seconds.
+        pandas.Series: The standardized call time in seconds.
     """
-    if not call_time:
-        return 0
-    return pd.to_timedelta(str(call_time)).total_seconds()
+    call_time = pd.to_timedelta(call_time.astype(str), errors="coerce")
+    return call_time.dt.total_seconds().fillna(0).astype("int64")
 
 
 def standardize_note_types(note_type: str) -> str:
@@ -253,23 +434,24 @@ def standardize_note_types(note_type: str) -> str:
     return str(note_type).split(",")[0]
 
 
-def standardize_vendor(row: pd.Series) -> pd.Series:
+def standardize_vendor(df: pd.DataFrame) -> pd.Series:
     """Original values had Vendor name in the Device name.
     If Vendor name is a substring of Device name then return the Vendor name.
     Else, if 'Tenvoi' or 'Omron' is in Device name then return 'Tenvoi' or 'Omron' respectively.
 
     Args:
-        row (pandas.Series): Row of Dataframe to be standardized.
+        df (pandas.DataFrame): Dataframe to be standardized.
 
     Returns:
-        pandas.Series: The standardized row of Dataframe.
+        pandas.Series: The standardized vendor names.
     """
-    if not row["Vendor"] in row["Device_Name"]:
-        if "Tenovi" in row["Device_Name"]:
-            return "Tenovi"
-        else:
-            return "Omron"
-    return row["Vendor"]
+    in_name = [vendor in name for vendor, name in zip(df["Vendor"], df["Device_Name"])]
+    is_tenovi = df["Device_Name"].str.contains("Tenovi", regex=False)
+    conditions = [in_name, is_tenovi]
+    vendor = np.select(
+        conditions, [df["Vendor"].astype(object), "Tenovi"], default="Omron"
+    )
+    return pd.Series(vendor, index=df.index)
 
 
 def standardize_emcontact_relationship(name: str) -> str:
@@ -303,45 +485,58 @@ def standardize_race(race: str) -> str:
     return keyword_list_search(race, race_keywords, keep_original=True)
 
 
-def standardize_weight(weight: str) -> str:
-    """Standardizes patient weight strings. Search values for common characters indicating height and remove them.
-    Remove all characters that aren't numeric. Check if weight string has more than 3 characters and trim values to only 3 characers.
+def standardize_weight(weight: pd.Series) -> pd.Series:
+    """Standardizes patient weight strings. Values with common characters indicating height are nulled.
+    Remove all characters that aren't numeric. Trim values with more than 3 digits to only 3 digits.
 
     Args:
-        weight (str): The value to be standardized.
+        weight (pandas.Series): The values to be standardized.
 
     Returns:
-        int: The standardized weight in pounds.
+        pandas.Series: The standardized weight in pounds.
     """
-    weight = str(weight).strip()
-    height_chars = ["'", '"', "ft", "in"]
-    if any(char in weight.lower() for char in height_chars):
-        return np.nan
-    weight = re.sub(r"\D", "", weight)
-    if len(weight) > 3:
-        weight = weight[:3]
-    return int(weight) if weight else 0
-
-
-def standardize_height(height: str) -> str:
-    """Standardizes patient height strings. Search values for common characters indicating weight and remove them.
+    weight = weight.astype(str).str.strip()
+    is_height = weight.str.lower().str.contains(height_unit_pattern, regex=True)
+    digits = (
+        weight.str.replace(non_digit_pattern, "", regex=True).str[:3].replace("", "0")
+    )
+    return pd.to_numeric(digits).mask(is_height).astype("Int64")
+
+
+def standardize_height(height: pd.Series) -> pd.Series:
+    """Standardizes patient height strings. Values with common characters indicating weight are nulled.
     Search values for strings that indicate height: 5ft2, 5'2", etc. Get the feet and inch values and converts to inches.
 
     Args:
-        height (str): The value to be standardized.
+        height (pandas.Series): The values to be standardized.
 
     Returns:
-        int: The standardized height in inches.
+        pandas.Series: The standardized height in inches.
     """
-    height = str(height).strip()
-    weight_chars = ["lbs", "kg"]
-    if any(char in height.lower() for char in weight_chars):
-        return np.nan
-    match = re.match(r"^(\d+)[\D]*?(\d+)?[\D]*?$", height)
-    if match:
-        feet = int(match.group(1))
-        inches = int(match.group(2)) if match.group(2) else 0
-        return (feet * 12) + inches
+    height = height.astype(str).str.strip()
+    is_weight = height.str.lower().str.contains(weight_unit_pattern, regex=True)
+    parts = height.str.extract(height_pattern)
+    feet = pd.to_numeric(parts[0])
+    inches = pd.to_numeric(parts[1]).fillna(0)
+    return ((feet * 12) + inches).mask(is_weight).astype("Int64")
+
+
+def standardize_reading(reading: pd.Series, decimals: int = 2) -> pd.Series:
+    """Standardizes device reading values. Values that aren't numeric are nulled.
+    Readings are rounded in place on a single float64 copy of the values.
+
+    Args:
+        reading (pandas.Series): The values to be standardized.
+        decimals (int): Number of decimal places to round to. Defaults to 2 (optional).
+
+    Returns:
+        pandas.Series: The standardized readings as floats.
+    """
+    values = pd.to_numeric(reading, errors="coerce").to_numpy(
+        dtype=np.float64, na_value=np.nan, copy=True
+    )
+    np.round(values, decimals, out=values)
+    return pd.Series(values, index=reading.index)
 
 
 # --- Create Functions ---
@@ -402,17 +597,16 @@ def create_patient_insurance_df(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def create_med_necessity_df(df: pd.DataFrame) -> pd.DataFrame:
-    med_nec_df = df[["evaluation_datetime", "temp_dx_code", "sharepoint_id"]]
-    med_nec_df.loc[:, "temp_dx_code"] = med_nec_df["temp_dx_code"].str.split(",")
-    med_nec_df = med_nec_df.explode("temp_dx_code", ignore_index=True)
-    return med_nec_df
+    med_nec_df = df[["evaluation_datetime", "temp_dx_code", "sharepoint_id"]].assign(
+        temp_dx_code=df["temp_dx_code"].str.split(",")
+    )
+    return med_nec_df.explode("temp_dx_code", ignore_index=True)
 
 
 def create_patient_status_df(df: pd.DataFrame) -> pd.DataFrame:
-    patient_status_df = df[["temp_status_type", "sharepoint_id"]]
-    patient_status_df["modified_date"] = pd.Timestamp.now()
-    patient_status_df["temp_user"] = "ITHelp"
-    return patient_status_df
+    return df[["temp_status_type", "sharepoint_id"]].assign(
+        modified_date=pd.Timestamp.now(), temp_user="ITHelp"
+    )
 
 
 def create_emcontacts_df(df: pd.DataFrame) -> pd.DataFrame:
@@ -446,7 +640,7 @@ def create_emcontacts_df(df: pd.DataFrame) -> pd.DataFrame:
             "emergency_relationship2": "relationship",
         }
     )
-    emcontacts_df = pd.concat([emcontacts_df1, emcontacts_df2])
+    emcontacts_df = pd.concat([emcontacts_df1, emcontacts_df2], ignore_index=True)
     emcontacts_df = emcontacts_df.dropna(subset=["full_name", "phone_number"])
     return emcontacts_df
 
@@ -474,34 +668,24 @@ def normalize_users(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def normalize_patients(df: pd.DataFrame) -> pd.DataFrame:
-    df["First Name"] = df["First Name"].apply(
-        standardize_name, args=(r"[^a-zA-Z\s.-]",)
-    )
-    df["Last Name"] = df["Last Name"].apply(standardize_name, args=(r"[^a-zA-Z\s.-]",))
+    df["First Name"] = standardize_name(df["First Name"], name_pattern)
+    df["Last Name"] = standardize_name(df["Last Name"], name_pattern)
     df["Full Name"] = df["First Name"] + " " + df["Last Name"]
-    df["Middle Name"] = df["Middle Name"].apply(
-        standardize_name, args=(r"[^a-zA-Z-\s]",)
-    )
-    df["Nickname"] = df["Nickname"].str.strip().str.title()
-    df["Phone Number"] = (
-        df["Phone Number"].astype(str).str.replace(r"\D", "", regex=True)
-    )
-    df["Gender"] = df["Gender"].replace({"Male": "M", "Female": "F"})
-    df["Email"] = df["Email"].apply(standardize_email)
-    df["Suffix"] = df["Suffix"].str.strip().str.title()
-    df["Social Security"] = (
-        df["Social Security"].astype(str).str.replace(r"\D", "", regex=True)
-    )
-    df["Race"] = df["Race"].apply(standardize_race)
-    df["Weight"] = df["Weight"].apply(standardize_weight)
-    df["Height"] = df["Height"].apply(standardize_height)
+    df["Middle Name"] = standardize_name(df["Middle Name"], middle_name_pattern)
+    df["Nickname"] = strip_title(df["Nickname"])
+    df["Phone Number"] = standardize_digits(df["Phone Number"])
+    df["Gender"] = df["Gender"].map({"Male": "M", "Female": "F"}).fillna(df["Gender"])
+    df["Email"] = standardize_email(df["Email"])
+    df["Suffix"] = strip_title(df["Suffix"])
+    df["Social Security"] = standardize_digits(df["Social Security"])
+    df["Race"] = apply_unique(df["Race"], standardize_race)
+    df["Weight"] = standardize_weight(df["Weight"])
+    df["Height"] = standardize_height(df["Height"])
 
     # The logic in standardize name can be used for address text as well.
-    df["Mailing Address"] = df["Mailing Address"].apply(
-        standardize_name, args=(r"[^a-zA-Z0-9\s#.-/]",)
-    )
-    df["City"] = df["City"].apply(standardize_name, args=(r"[^a-zA-Z-]",))
-    df["State"] = df["State"].apply(standardize_state)
+    df["Mailing Address"] = standardize_name(df["Mailing Address"], address_pattern)
+    df["City"] = standardize_name(df["City"], city_pattern)
+    df["State"] = standardize_state(df["State"])
     df["Zip code"] = df["Zip code"].astype(str).str.split("-", n=1).str[0]
 
     df["EmergencyRelationship"] = df["EmergencyName"].apply(
@@ -510,34 +694,34 @@ def normalize_patients(df: pd.DataFrame) -> pd.DataFrame:
     df["EmergencyRelationship2"] = df["EmergencyName2"].apply(
         standardize_emcontact_relationship
     )
-    df["EmergencyName"] = df["EmergencyName"].apply(
-        standardize_name, args=(r"[^a-zA-Z\s.-/()]",)
-    )
-    df["EmergencyNumber"] = (
-        df["EmergencyNumber"].astype(str).str.replace(r"\D", "", regex=True)
+    df["EmergencyName"] = standardize_name(df["EmergencyName"], emcontact_name_pattern)
+    df["EmergencyNumber"] = standardize_digits(df["EmergencyNumber"])
+    df["EmergencyName2"] = standardize_name(
+        df["EmergencyName2"], emcontact_name_pattern
     )
-    df["EmergencyName2"] = df["EmergencyName2"].apply(
-        standardize_name, args=(r"[^a-zA-Z\s.-/()]",)
+    df["EmergencyNumber2"] = standardize_digits(df["EmergencyNumber2"])
+
+    df["Medicare ID number"] = standardize_mbi(df["Medicare ID number"])
+    df["DX_Code"] = standardize_dx_code(df["DX_Code"])
+    df["Insurance ID:"] = standardize_insurance_id(df["Insurance ID:"])
+    df["InsuranceID2"] = standardize_insurance_id(df["InsuranceID2"])
+    df["Insurance Name:"] = apply_unique(
+        df["Insurance Name:"], standardize_insurance_name
     )
-    df["EmergencyNumber2"] = (
-        df["EmergencyNumber2"].astype(str).str.replace(r"\D", "", regex=True)
+    df["InsuranceName2"] = apply_unique(
+        df["InsuranceName2"], standardize_insurance_name
     )
-
-    df["Medicare ID number"] = df["Medicare ID number"].apply(standardize_mbi)
-    df["DX_Code"] = df["DX_Code"].apply(standardize_dx_code)
-    df["Insurance ID:"] = df["Insurance ID:"].apply(standardize_insurance_id)
-    df["InsuranceID2"] = df["InsuranceID2"].apply(standardize_insurance_id)
-    df["Insurance Name:"] = df["Insurance Name:"].apply(standardize_insurance_name)
-    df["InsuranceName2"] = df["InsuranceName2"].apply(standardize_insurance_name)
-    df["Insurance Name:"] = df.apply(fill_primary_payer, axis=1)
-    df["Insurance ID:"] = df.apply(fill_primary_payer_id, axis=1)
+    df["Insurance Name:"] = fill_primary_payer(df)
+    df["Insurance ID:"] = fill_primary_payer_id(df)
 
     previous_patient_statuses = {
         "DO NOT CALL": "Do Not Call",
         "In-Active": "Inactive",
         "On-Board": "Onboard",
     }
-    df["Member_Status"] = df["Member_Status"].replace(previous_patient_statuses)
+    df["Member_Status"] = (
+        df["Member_Status"].map(previous_patient_statuses).fillna(df["Member_Status"])
+    )
     df = df.rename(
         columns={
             "First Name": "first_name",
@@ -579,20 +763,34 @@ def normalize_patients(df: pd.DataFrame) -> pd.DataFrame:
         }
     )
     # Convert string Nan back to Null value.
-    df.replace(r"(?i)^nan$", None, regex=True, inplace=True)
+    df = null_nan_columns(df)
+    # Low cardinality text columns are stored as categories.
+    for col in ["sex", "temp_race", "temp_marital_status", "temp_status_type"]:
+        df[col] = df[col].astype("category")
     return df
 
 
 def normalize_patient_notes(df: pd.DataFrame) -> pd.DataFrame:
-    df["Recording_Time"] = df["Recording_Time"].apply(standardize_call_time)
+    df["Recording_Time"] = standardize_call_time(df["Recording_Time"])
     df.loc[df["LCH_UPN"].isin(["NursePractitioner"]), "Recording_Time"] = 900
 
-    df["Notes"] = df["Notes"].apply(html.unescape)
-    df["Notes"] = df["Notes"].str.replace(r"<.*?>", "", regex=True)
+    # Note text is the largest column, it is kept as Arrow backed strings.
+    # Entities need Python's HTML5 table, the tags are stripped by the Arrow regex kernel.
+    notes = pd.Series(
+        [
+            html.unescape(note) if isinstance(note, str) else None
+            for note in df["Notes"].to_numpy()
+        ],
+        index=df.index,
+        dtype="string[pyarrow]",
+    )
+    df["Notes"] = notes.str.replace(html_tag_pattern.pattern, "", regex=True)
 
-    df["Time_Note"] = df["Time_Note"].apply(standardize_note_types)
+    df["Time_Note"] = apply_unique(df["Time_Note"], standardize_note_types)
     df.loc[
-        df["LCH_UPN"].isin(["NursePractitioner", "RegisteredNurse1", "RegisteredNurse2"]),
+        df["LCH_UPN"].isin(
+            ["NursePractitioner", "RegisteredNurse1", "RegisteredNurse2"]
+        ),
         "Time_Note",
     ] = "Initial Evaluation"
     df.loc[
@@ -628,14 +826,14 @@ def normalize_patient_notes(df: pd.DataFrame) -> pd.DataFrame:
         }
     )
     # Convert string Nan back to Null value.
-    df.replace(r"(?i)^na(n)?$", None, regex=True, inplace=True)
+    df = null_nan_columns(df, ("na", "nan"))
     return df
 
 
 def normalize_devices(df: pd.DataFrame) -> pd.DataFrame:
     df["Patient_ID"] = df["Patient_ID"].astype("Int64")
     df["Device_ID"] = df["Device_ID"].str.replace("-", "")
-    df["Vendor"] = df.apply(standardize_vendor, axis=1)
+    df["Vendor"] = standardize_vendor(df).astype("category")
     df = df.rename(
         columns={
             "Device_ID": "hardware_uuid",
@@ -648,10 +846,10 @@ def normalize_devices(df: pd.DataFrame) -> pd.DataFrame:
 
 def normalize_bp_readings(df: pd.DataFrame) -> pd.DataFrame:
     df["SharePoint_ID"] = df["SharePoint_ID"].astype("Int64")
-    df["Manual_Reading"] = df["Manual_Reading"].replace({True: 1, False: 0})
     df["Manual_Reading"] = df["Manual_Reading"].astype("Int64")
-    df["BP_Reading_Systolic"] = df["BP_Reading_Systolic"].astype(float).round(2)
-    df["BP_Reading_Diastolic"] = df["BP_Reading_Diastolic"].astype(float).round(2)
+    df["BP_Reading_Systolic"] = standardize_reading(df["BP_Reading_Systolic"])
+    df["BP_Reading_Diastolic"] = standardize_reading(df["BP_Reading_Diastolic"])
+    df["Device_Model"] = df["Device_Model"].astype("category")
     df = df.rename(
         columns={
             "SharePoint_ID": "sharepoint_id",
@@ -668,9 +866,9 @@ def normalize_bp_readings(df: pd.DataFrame) -> pd.DataFrame:
 
 def normalize_bg_readings(df: pd.DataFrame) -> pd.DataFrame:
     df["SharePoint_ID"] = df["SharePoint_ID"].astype("Int64")
-    df["Manual_Reading"] = df["Manual_Reading"].replace({True: 1, False: 0})
     df["Manual_Reading"] = df["Manual_Reading"].astype("Int64")
-    df["BG_Reading"] = df["BG_Reading"].astype(float).round(2)
+    df["BG_Reading"] = standardize_reading(df["BG_Reading"])
+    df["Device_Model"] = df["Device_Model"].astype("category")
     df = df.rename(
         columns={
             "SharePoint_ID": "sharepoint_id",
@@ -712,29 +910,47 @@ def normalize_bg_readings(df: pd.DataFrame) -> pd.DataFrame:
 
 
 def check_patient_db_constraints(df: pd.DataFrame) -> pd.DataFrame:
-    df = df[df["phone_number"].apply(lambda x: len(str(x)) <= 11)]
-    df = df[df["social_security"].apply(lambda x: len(str(x)) <= 9)]
-    df = df[df["temp_state"].apply(lambda x: len(str(x)) <= 2)]
-    df = df[df["zipcode"].apply(lambda x: len(str(x)) <= 5)]
-    df = df[df["emergency_phone_number"].apply(lambda x: len(str(x)) <= 11)]
-    df = df[df["emergency_phone_number2"].apply(lambda x: len(str(x)) <= 11)]
-    df = df[df["medicare_beneficiary_id"].apply(lambda x: len(str(x)) <= 11)]
-    df = df[df["primary_payer_id"].apply(lambda x: len(str(x)) <= 30)]
-    df = df[df["secondary_payer_id"].apply(lambda x: len(str(x)) <= 30)]
-    return df
+    max_lengths = {
+        "phone_number": 11,
+        "social_security": 9,
+        "temp_state": 2,
+        "zipcode": 5,
+        "emergency_phone_number": 11,
+        "emergency_phone_number2": 11,
+        "medicare_beneficiary_id": 11,
+        "primary_payer_id": 30,
+        "secondary_payer_id": 30,
+    }
+    mask = np.logical_and.reduce(
+        [
+            df[col].astype(str).str.len().le(length)
+            for col, length in max_lengths.items()
+        ]
+    )
+    return df[mask]
 
 
-def add_id_col(df: pd.DataFrame, id_df: pd.DataFrame, col: str) -> pd.DataFrame:
-    """Merge pandas dataframes on specified column. Remove specified column after merge.
+def add_id_col(
+    df: pd.DataFrame, id_df: pd.DataFrame | pd.Series, col: str
+) -> pd.DataFrame:
+    """Map an ID column onto the target dataframe by key. Remove specified column after mapping.
+    Rows without a matching key are dropped. Duplicate keys in the ID dataframe are merged instead, one row per matching ID.
 
     Args:
         df (pandas.DataFrame): Target dataframe requiring ID column.
-        id_df (pandas.DataFrame): ID dataframe containing ID column.
-        col (str): Column name to be merged and deleted.
+        id_df (pandas.DataFrame, pandas.Series): ID dataframe containing ID column, or ID series indexed by key.
+        col (str): Column name to be mapped and deleted.
 
     Returns:
-        pandas.Series: Target dataframe with newly added ID column.
+        pandas.DataFrame: Target dataframe with newly added ID column.
     """
-    df = pd.merge(df, id_df, on=col)
-    df.drop(columns=[col], inplace=True)
-    return df
+    if isinstance(id_df, pd.DataFrame):
+        id_df = id_df.set_index(col).iloc[:, 0]
+    if not id_df.index.is_unique:
+        df = df.merge(id_df.rename_axis(col).reset_index(), on=col)
+        return df.drop(columns=[col])
+    id_col = id_df.name
+    df = df.assign(**{id_col: df[col].map(id_df)})
+    df = df.dropna(subset=[id_col]).drop(columns=[col])
+    df[id_col] = df[id_col].astype(id_df.dtype)
+    return df.reset_index(drop=True)
@@ -1,12 +1,22 @@
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import pandas as pd
-from typing import List
-from sqlalchemy import create_engine, event, text, Row
-from sqlalchemy.engine import URL
+from contextlib import AbstractContextManager
+from typing import Dict, Iterator, List
+from sqlalchemy import create_engine, text, Row, TextClause
+from sqlalchemy.engine import URL, Connection, Engine
 from sqlalchemy.orm import sessionmaker, Session
 
 
 class DatabaseManager:
+    # Engines are shared by every manager connecting to the same URL, so each database has one pool.
+    # Keyed by the URL without its password and the engine options, released by dispose_all().
+    _engines: Dict[tuple, Engine] = {}
+    _engines_lock = threading.Lock()
+    # Parsed statements are shared too, the engine's compiled cache is keyed on the same clause.
+    _statements: Dict[str, TextClause] = {}
+
     def __init__(self, logger=None):
         """
         Initializes the DatabaseManager with an optional logger.
@@ -18,29 +28,14 @@ class DatabaseManager:
         self.engine = None
         self.session = None
 
-    @staticmethod
-    def __receive_before_cursor_execute(
-        conn, cursor, statement, params, context, executemany
-    ):
-        """
-        Event listener to enable fast execution of multiple statements.
-
-        Args:
-            conn: Connection object.
-            cursor: Cursor object.
-            statement: SQL statement.
-            params: Parameters for the SQL statement.
-            context: Execution context.
-            executemany: Boolean indicating if multiple statements are being executed.
-        """
-        if executemany:
-            cursor.fast_executemany = True
-
     def create_engine(
         self, username: str, password: str, host: str, database: str
     ) -> None:
         """
         Creates a SQLAlchemy engine object with the provided credentials and sets up the session.
+        Engines are cached by connection URL, repeat calls for the same database reuse its connection pool.
+        Bulk inserts use pyodbc fast_executemany, set once on the dialect.
+        Pooled connections are checked before use and replaced after 30 minutes, before idle connections are dropped by the server.
 
         Args:
             username (str): The username for the database.
@@ -60,13 +55,37 @@ class DatabaseManager:
                 "TrustServerCertificate": "yes",
             },
         )
-        engine = create_engine(connection_url)
-        event.listen(
-            engine, "before_cursor_execute", self.__receive_before_cursor_execute
+        engine_options = {
+            "fast_executemany": True,
+            "pool_size": 5,
+            "max_overflow": 10,
+            "pool_pre_ping": True,
+            "pool_recycle": 1800,
+        }
+        key = (
+            connection_url.render_as_string(hide_password=True),
+            tuple(sorted(engine_options.items())),
         )
+        with self._engines_lock:
+            engine = self._engines.get(key)
+            if engine is None:
+                engine = create_engine(connection_url, **engine_options)
+                self._engines[key] = engine
         self.engine = engine
         self.session = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
 
+    @classmethod
+    def dispose_all(
+        cls,
+    ) -> None:
+        """
+        Closes the connection pools of every shared engine and clears the engine cache. Call once at shutdown.
+        """
+        with cls._engines_lock:
+            for engine in cls._engines.values():
+                engine.dispose()
+            cls._engines.clear()
+
     def get_session(
         self,
     ) -> Session:
@@ -85,6 +104,50 @@ class DatabaseManager:
             )
         return self.session()
 
+    def begin(
+        self,
+    ) -> AbstractContextManager[Connection]:
+        """
+        Checks out a pooled connection and begins a transaction.
+        The transaction commits when the block exits, or rolls back on an error, and the connection returns to the pool.
+
+        Returns:
+            AbstractContextManager[Connection]: Context manager yielding the connection.
+
+        Raises:
+            Exception: If the database connection is not established.
+        """
+        if not self.engine:
+            raise Exception(
+                "Database connection is not established. Call create_engine() first."
+            )
+        return self.engine.begin()
+
+    def log_query(self, query: str) -> None:
+        """
+        Logs a SQL query on one line at debug level. The query is only reformatted when debug logging is enabled.
+
+        Args:
+            query (str): The SQL query to log.
+        """
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug("Query: %s", query.replace("\n", " "))
+
+    def statement(self, query: str) -> TextClause:
+        """
+        Returns the parsed SQL statement for a query, parsing each distinct query once.
+
+        Args:
+            query (str): The SQL query to parse.
+
+        Returns:
+            TextClause: The SQLAlchemy statement.
+        """
+        stmt = self._statements.get(query)
+        if stmt is None:
+            stmt = self._statements.setdefault(query, text(query))
+        return stmt
+
     def execute_query(self, query: str, params: dict = None) -> List[Row]:
         """
         Executes a SQL query and returns the result.
@@ -97,23 +160,90 @@ class DatabaseManager:
             List[Row]: SQLAlchemy result rows.
 
         Raises:
-            Exception: If there is an error executing the query.
+            Exception: If the database connection is not established.
         """
-        session = self.get_session()
+        transaction = self.begin()
         try:
-            self.logger.debug(f'Query: {query.replace("\n", " ")}')
-            res = session.execute(text(query), params)
-            session.commit()
-            if res.returns_rows:
-                return res.fetchall()
+            with transaction as conn:
+                self.log_query(query)
+                res = conn.execute(self.statement(query), params)
+                if res.returns_rows:
+                    return res.fetchall()
         except Exception as e:
-            session.rollback()
             self.logger.error(f"Error executing query: {e}")
-        finally:
-            session.close()
+
+    def execute_many(self, queries: List[str], params: dict = None) -> bool:
+        """
+        Executes multiple SQL queries in a single transaction. Rolls back all queries if one fails.
+
+        Args:
+            queries (List[str]): The SQL queries to execute in order.
+            params (dict): Query parameters used in each execution. Defaults to None (optional).
+
+        Returns:
+            bool: True if the transaction was committed, False if it was rolled back.
+
+        Raises:
+            Exception: If the database connection is not established.
+        """
+        transaction = self.begin()
+        try:
+            with transaction as conn:
+                for query in queries:
+                    self.log_query(query)
+                    conn.execute(self.statement(query), params)
+            return True
+        except Exception as e:
+            self.logger.error(f"Error executing queries: {e}")
+            return False
+
+    def execute_batch(self, query: str, params: List[dict]) -> None:
+        """
+        Executes one SQL query for each set of parameters in a single executemany call and transaction.
+        Rolls back all executions if one fails.
+
+        Args:
+            query (str): The SQL query to execute.
+            params (List[dict]): Query parameters for each execution.
+
+        Raises:
+            Exception: If the database connection is not established.
+        """
+        transaction = self.begin()
+        try:
+            with transaction as conn:
+                self.log_query(query)
+                self.logger.debug(f"Executing batch (rows: {len(params)})...")
+                conn.execute(self.statement(query), params)
+        except Exception as e:
+            self.logger.error(f"Error executing batch: {e}")
+
+    def execute_concurrent(
+        self, queries: List[str], params: dict = None, max_workers: int = 5
+    ) -> List[List[Row]]:
+        """
+        Executes independent SQL queries concurrently, each on its own pooled connection and transaction.
+        Client work waits on one round trip instead of one per query.
+
+        Args:
+            queries (List[str]): The SQL queries to execute. They must not depend on each other's results.
+            params (dict): Query parameters used in each execution. Defaults to None (optional).
+            max_workers (int): Maximum number of concurrent queries, matched to the connection pool size. Defaults to 5 (optional).
+
+        Returns:
+            List[List[Row]]: SQLAlchemy result rows for each query, in the order given.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(lambda query: self.execute_query(query, params), queries)
+            )
 
     def read_sql(
-        self, query: str, params: tuple = None, parse_dates: List[str] = None
+        self,
+        query: str,
+        params: tuple = None,
+        parse_dates: List[str] = None,
+        dtype_backend: str = None,
     ) -> pd.DataFrame:
         """
         Reads a SQL query and returns the result as a DataFrame.
@@ -122,37 +252,110 @@ class DatabaseManager:
             query (str): The SQL query to execute.
             params (tuple): Query parameters used in execution. Defaults to None (optional).
             parse_dates (List[str]): List of column names to parse as datetime. Defaults to None (optional).
+            dtype_backend (str): Backend for the column dtypes, 'numpy_nullable' or 'pyarrow'. Defaults to None (optional).
 
         Returns:
             pd.DataFrame: The query results as a DataFrame.
         """
-        df = pd.read_sql(query, self.engine, params=params, parse_dates=parse_dates)
-        self.logger.debug(f'Query: {query.replace("\n", " ")}')
+        kwargs = {"dtype_backend": dtype_backend} if dtype_backend else {}
+        df = pd.read_sql(
+            query, self.engine, params=params, parse_dates=parse_dates, **kwargs
+        )
+        self.log_query(query)
         self.logger.debug(f"Reading (rows: {df.shape[0]}, cols: {df.shape[1]})...")
         return df
 
+    def read_sql_iter(
+        self,
+        query: str,
+        params: tuple = None,
+        parse_dates: List[str] = None,
+        chunksize: int = 10000,
+        dtype_backend: str = None,
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Reads a SQL query in chunks through a server-side cursor, so only one chunk of rows is held at a time.
+
+        Args:
+            query (str): The SQL query to execute.
+            params (tuple): Query parameters used in execution. Defaults to None (optional).
+            parse_dates (List[str]): List of column names to parse as datetime. Defaults to None (optional).
+            chunksize (int): Number of rows per DataFrame. Defaults to 10000 (optional).
+            dtype_backend (str): Backend for the column dtypes, 'numpy_nullable' or 'pyarrow'. Defaults to None (optional).
+
+        Yields:
+            pd.DataFrame: The next chunk of query results.
+        """
+        kwargs = {"dtype_backend": dtype_backend} if dtype_backend else {}
+        self.log_query(query)
+        with self.engine.connect().execution_options(yield_per=chunksize) as conn:
+            for df in pd.read_sql(
+                query,
+                conn,
+                params=params,
+                parse_dates=parse_dates,
+                chunksize=chunksize,
+                **kwargs,
+            ):
+                self.logger.debug(
+                    f"Reading chunk (rows: {df.shape[0]}, cols: {df.shape[1]})..."
+                )
+                yield df
+
     def to_sql(
-        self, df: pd.DataFrame, table: str, if_exists: str = "fail", index: bool = False
+        self,
+        df: pd.DataFrame,
+        table: str,
+        if_exists: str = "fail",
+        index: bool = False,
+        chunksize: int = 10000,
+        method: str = None,
     ) -> None:
         """
         Saves a Pandas DataFrame to a SQL table.
+        Rows are sent with pyodbc fast_executemany unless a different insertion method is given.
+        With a chunksize, each chunk is converted and inserted on its own, so only one chunk of rows is held as Python values.
+        All chunks are written in a single transaction.
 
         Args:
             df (pd.DataFrame): The DataFrame to be written to the SQL table.
             table (str): The name of the target SQL table.
             if_exists (str): Specifies what to do if the table already exists. Defaults to 'fail' (optional).
             index (bool): Whether to write the DataFrame's index as a column. Defaults to False (optional).
+            chunksize (int): Number of rows written per batch. Defaults to 10000, None writes all rows at once (optional).
+            method (str): Pandas insertion method, e.g. 'multi'. Defaults to None, one executemany per batch (optional).
         """
         self.logger.debug(
             f"Writing (rows: {df.shape[0]}, cols: {df.shape[1]}) to {table}..."
         )
-        df.to_sql(table, self.engine, if_exists=if_exists, index=index)
+        if not chunksize or len(df) <= chunksize:
+            df.to_sql(
+                table,
+                self.engine,
+                if_exists=if_exists,
+                index=index,
+                chunksize=chunksize,
+                method=method,
+            )
+            return
+        # pandas converts the whole frame to Python values before its own chunking.
+        with self.begin() as conn:
+            for start in range(0, len(df), chunksize):
+                df.iloc[start : start + chunksize].to_sql(
+                    table,
+                    conn,
+                    if_exists=if_exists if start == 0 else "append",
+                    index=index,
+                    method=method,
+                )
 
     def close(
         self,
     ) -> None:
         """
         Closes the database connection.
+        The manager drops its engine and session, so later queries raise instead of reconnecting.
+        The shared connection pool stays open for other managers until dispose_all() is called.
         """
-        if self.engine:
-            self.engine.dispose()
+        self.engine = None
+        self.session = None